@@ -14,10 +14,12 @@ Features:
     - Comprehensive progress reporting and error logging
 
 Usage:
-    python3 run_all.py [--no-upload]
+    python3 run_all.py [--no-upload] [--refresh-contest] [--force]
 
 Arguments:
     --no-upload: Skip automatic Google Sheets upload (optional)
+    --refresh-contest: Ignore the cached DraftKings contest for this week (optional)
+    --force: Re-upload every CSV even if unchanged since its last upload (optional)
 
 Examples:
     python3 run_all.py                  # Complete workflow with upload
@@ -29,12 +31,6 @@ import argparse
 from utils.config import get_scraper_configs
 from utils.csv_cleanup import clear_old_csvs
 from utils.scraper_runner import run_scrapers, print_results_summary
-from utils.workflow import (
-    organize_files,
-    print_final_summary,
-    print_workflow_header,
-    upload_to_sheets,
-)
 
 
 def main() -> bool:
@@ -71,8 +67,26 @@ def main() -> bool:
         type=int,
         help='NFL week number (1-18)'
     )
+    parser.add_argument(
+        '--refresh-contest',
+        action='store_true',
+        help='Ignore the cached DraftKings contest and query the API again'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-upload every CSV even if unchanged since its last upload'
+    )
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors skip the Google Sheets/pandas imports
+    from utils.workflow import (
+        organize_files,
+        print_final_summary,
+        print_workflow_header,
+        upload_to_sheets,
+    )
+
     print_workflow_header()
 
     cleanup_success = clear_old_csvs()
@@ -83,6 +97,8 @@ def main() -> bool:
     scraper_args = []
     if args.week:
         scraper_args.extend(['--week', str(args.week)])
+    if args.refresh_contest:
+        scraper_args.append('--refresh-contest')
     results = run_scrapers(scrapers, scraper_args)
     successful, total = print_results_summary(results, "Collection Summary")
 
@@ -90,7 +106,7 @@ def main() -> bool:
 
     upload_success = False
     if not args.no_upload:
-        upload_success = upload_to_sheets()
+        upload_success = upload_to_sheets(force=args.force)
     else:
         print("📊 Google Sheets upload skipped (--no-upload flag)")
 
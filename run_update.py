@@ -19,10 +19,11 @@ Data Sources:
     ⏭️  DraftKings salaries (updated weekly, skipped for efficiency)
 
 Usage:
-    python3 run_update.py [--no-upload]
+    python3 run_update.py [--no-upload] [--force]
 
 Arguments:
     --no-upload: Skip automatic Google Sheets upload (optional)
+    --force: Re-upload every CSV even if unchanged since its last upload (optional)
 
 Examples:
     python3 run_update.py               # Quick update with upload
@@ -37,12 +38,6 @@ import argparse
 
 from utils.config import get_update_scrapers
 from utils.scraper_runner import run_scrapers, print_results_summary
-from utils.workflow import (
-    organize_files,
-    print_update_header,
-    print_update_summary,
-    upload_to_sheets,
-)
 
 
 def main() -> bool:
@@ -85,8 +80,21 @@ def main() -> bool:
         type=int,
         help='NFL week number (1-18)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-upload every CSV even if unchanged since its last upload'
+    )
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors skip the Google Sheets/pandas imports
+    from utils.workflow import (
+        organize_files,
+        print_update_header,
+        print_update_summary,
+        upload_to_sheets,
+    )
+
     print_update_header()
 
     scrapers = get_update_scrapers()
@@ -100,7 +108,7 @@ def main() -> bool:
 
     upload_success = False
     if not args.no_upload:
-        upload_success = upload_to_sheets()
+        upload_success = upload_to_sheets(force=args.force)
 
     print_update_summary(successful, total, upload_success, args.no_upload)
 
@@ -6,28 +6,69 @@ Automatically finds the current week's main NFL slate and downloads player salar
 Uses your existing browser login (Arc, Chrome, Safari, etc.) for authentication.
 
 Usage:
-    python scraper.py
+    python scraper.py [--refresh-contest]
 """
 
+import functools
+import json
+import os
 import subprocess
 import sys
 import time
 import webbrowser
 import re
-import platform
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Add utils to path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent / 'utils'))
-from scraper_common import DEFAULT_TIMEOUT, BROWSER_WAIT_TIME
+from scraper_common import DEFAULT_TIMEOUT, BROWSER_WAIT_TIME, get_current_nfl_week
 
 # Configuration constants
 DRAFTKINGS_API_URL = "https://api.draftkings.com/draftgroups/v1/"
 DRAFTKINGS_CSV_BASE_URL = "https://www.draftkings.com/lineup/getavailableplayerscsv"
 DEFAULT_CSV_FILENAME = "DraftKings NFL Salaries.csv"
+CSV_CHUNK_SIZE = 64 * 1024  # Bytes per chunk when streaming the salary CSV
+LOCKED_MARKER = b"(LOCKED)"  # Placeholder text returned when not authenticated
+LOCKED_SCAN_SIZE = 8192  # Bytes at the start of the CSV searched for LOCKED_MARKER
+APPLESCRIPT_TIMEOUT = 10  # Seconds before an osascript call is abandoned
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
+# Shared session so the API and CSV requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update(REQUEST_HEADERS)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+CONTEST_CACHE_FILE = Path.home() / ".cache" / "dfs" / "dk_contest.json"
+CONTEST_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # Seconds before a cached contest is always refetched
+MAIN_SLATE_MIN_GAMES = 10  # Smaller picks may be a secondary slate posted before the main one, so aren't cached
+
+# Start time formats, grouped by date layout so only the matching family is tried
+# Kickoff windows are defined in Eastern time; API timestamps are UTC
+try:
+    EASTERN_TZ = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:
+    EASTERN_TZ = timezone(timedelta(hours=-4))  # EDT, in effect for most of the season
+
+ISO_DATE_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S.%fZ',  # ISO format with microseconds
+    '%Y-%m-%dT%H:%M:%SZ',     # ISO format
+    '%Y-%m-%d %H:%M:%S',      # Standard datetime
+)
+US_DATE_FORMATS = (
+    '%m/%d/%Y %H:%M:%S',      # US date format
+    '%m-%d-%Y %H:%M:%S',      # US date format with dashes
+)
+
+# Fallback patterns for free-form start times such as "09/07/2025 01:00PM ET"
+TIME_ET_PATTERN = re.compile(r'(\d{1,2}):(\d{2})(AM|PM)\s*ET', re.IGNORECASE)
+US_DATE_PATTERN = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+ISO_DATE_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})')
 
 
 def get_unique_filename(downloads_dir, base_filename):
@@ -56,12 +97,14 @@ def get_unique_filename(downloads_dir, base_filename):
     return downloads_dir / unique_filename
 
 
+@functools.lru_cache(maxsize=256)
 def _is_sunday_afternoon_game(start_time):
     """
     Check if a game start time represents a Sunday afternoon game (12 PM - 5 PM ET).
 
     Uses dynamic date parsing to identify Sunday afternoon games regardless of the week.
-    Excludes Sunday Night Football (typically 8 PM ET or later).
+    Excludes Sunday Night Football (typically 8 PM ET or later). Results are cached,
+    since draft groups on the same slate share kickoff times.
 
     Args:
         start_time (str): Game start time string from DraftKings API
@@ -72,35 +115,49 @@ def _is_sunday_afternoon_game(start_time):
     if not start_time:
         return False
 
-    # Try to parse various date formats and check if it's a Sunday afternoon game
-    date_formats = [
-        '%Y-%m-%dT%H:%M:%S.%fZ',  # ISO format with microseconds
-        '%Y-%m-%dT%H:%M:%SZ',     # ISO format
-        '%Y-%m-%d %H:%M:%S',      # Standard datetime
-        '%m/%d/%Y %H:%M:%S',      # US date format
-        '%m-%d-%Y %H:%M:%S',      # US date format with dashes
-    ]
-
-    for date_format in date_formats:
+    # Year-first strings have a dash at index 4; skip formats that cannot match
+    is_year_first = start_time[4:5] == '-'
+
+    parsed_datetime = None
+    if is_year_first and len(start_time) > 10:  # Date-only strings use the fallback below
+        # Fast path for the ISO timestamps returned by the DraftKings API
         try:
-            parsed_datetime = datetime.strptime(start_time, date_format)
-            # Check if it's Sunday (weekday == 6)
-            if parsed_datetime.weekday() != 6:
-                return False
+            iso_time = start_time[:-1] + '+00:00' if start_time.endswith('Z') else start_time
+            parsed_datetime = datetime.fromisoformat(iso_time)
+        except ValueError:
+            pass
 
-            # Check if it's afternoon time (12 PM - 5 PM ET)
-            # Assuming input times are already in ET
-            hour = parsed_datetime.hour
-            return 12 <= hour <= 17  # 12 PM (noon) to 5 PM
+    # Try to parse various date formats and check if it's a Sunday afternoon game
+    if parsed_datetime is None:
+        date_formats = ISO_DATE_FORMATS if is_year_first else US_DATE_FORMATS
+        for date_format in date_formats:
+            try:
+                parsed_datetime = datetime.strptime(start_time, date_format)
+            except ValueError:
+                continue
+            if date_format.endswith('Z'):
+                parsed_datetime = parsed_datetime.replace(tzinfo=timezone.utc)
+            break
+
+    if parsed_datetime is not None:
+        # UTC timestamps must be judged by the Eastern kickoff time, not the UTC hour
+        if parsed_datetime.tzinfo is not None:
+            parsed_datetime = parsed_datetime.astimezone(EASTERN_TZ)
+
+        # Check if it's Sunday (weekday == 6)
+        if parsed_datetime.weekday() != 6:
+            return False
 
-        except ValueError:
-            continue
+        # Check if it's afternoon time (12 PM - 5 PM ET)
+        # Naive times without a zone are assumed to already be in ET
+        hour = parsed_datetime.hour
+        return 12 <= hour <= 17  # 12 PM (noon) to 5 PM
 
     # If no datetime format matches, try extracting date and look for time patterns
     try:
         # Look for patterns like "09/07/2025 01:00PM ET" or "09/07/2025 04:25PM ET"
-        time_match = re.search(r'(\d{1,2}):(\d{2})(AM|PM)\s*ET', start_time, re.IGNORECASE)
-        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', start_time)
+        time_match = TIME_ET_PATTERN.search(start_time)
+        date_match = US_DATE_PATTERN.search(start_time)
 
         if time_match and date_match:
             # Parse the date
@@ -122,7 +179,7 @@ def _is_sunday_afternoon_game(start_time):
             return 12 <= hour <= 17
 
         # Look for YYYY-MM-DD pattern and check if it's Sunday (fallback)
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', start_time)
+        date_match = ISO_DATE_PATTERN.search(start_time)
         if date_match:
             parsed_date = datetime.strptime(date_match.group(1), '%Y-%m-%d')
             # If no time info, assume it's an afternoon game if it's Sunday
@@ -135,7 +192,25 @@ def _is_sunday_afternoon_game(start_time):
     return False
 
 
-def get_current_nfl_contest():
+def _get_game_start_time(game):
+    """
+    Get a game's start time from a DraftKings draft group entry.
+
+    Args:
+        game (dict): Game entry from the draft group's 'games' list
+
+    Returns:
+        str: Start time string, or an empty string if none is present
+    """
+    # Try different possible field names for game start time
+    return (game.get('startTime', '') or
+            game.get('startDate', '') or
+            game.get('gameTime', '') or
+            game.get('date', '') or
+            game.get('startDateTime', ''))
+
+
+def _fetch_current_nfl_contest():
     """
     Get the Fantasy Football Millionaire contest (Sunday afternoon games only) from DraftKings API.
 
@@ -145,96 +220,60 @@ def get_current_nfl_contest():
     Typically 12+ games representing the main Sunday afternoon slate.
 
     Returns:
-        str or None: CSV download URL for the Sunday afternoon Millionaire contest, or None if not found
+        dict or None: Contest info with csv_url, draft_group_id and game_count, or None if not found
     """
     try:
         print("🔍 Fetching current NFL contests from DraftKings API...")
         print("🎯 Looking for Fantasy Football Millionaire contest with Sunday afternoon games (12-5 PM ET)...")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-
-        response = requests.get(
+        response = _SESSION.get(
             DRAFTKINGS_API_URL,
-            headers=headers,
             timeout=DEFAULT_TIMEOUT
         )
         response.raise_for_status()
 
         data = response.json()
-        nfl_contests = [
-            contest for contest in data['draftGroups']
-            if contest['contestType']['sport'] == 'NFL'
-        ]
-
-        # Find Fantasy Football Millionaire contests (type 21) that start on Sunday
-        millionaire_contests = []
-
-        for contest in nfl_contests:
-            if (contest.get('draftGroupState') == 'Upcoming' and
-                contest['contestType']['contestTypeId'] == 21):
-
-                game_count = len(contest.get('games', []))
-                if game_count > 0:
-                    # Check if contest starts on Sunday by looking at game times
-                    games = contest.get('games', [])
-                    sunday_games = 0
-
-                    non_sunday_games = 0
-                    for i, game in enumerate(games):
-
-                        # Try different possible field names for game start time
-                        start_time = (game.get('startTime', '') or
-                                    game.get('startDate', '') or
-                                    game.get('gameTime', '') or
-                                    game.get('date', '') or
-                                    game.get('startDateTime', ''))
-
-                        # Check if this game is on Sunday afternoon (12 PM - 5 PM ET)
-                        is_sunday_afternoon = _is_sunday_afternoon_game(start_time)
-
-                        if is_sunday_afternoon:
-                            sunday_games += 1
-                        else:
-                            non_sunday_games += 1
-
-                    # Only consider contests with ONLY Sunday afternoon games (no Sunday Night Football, Monday, Thursday, etc.)
-                    is_sunday_afternoon_only_slate = (sunday_games > 0 and non_sunday_games == 0)
-                    millionaire_contests.append({
-                        'contest': contest,
-                        'game_count': game_count,
-                        'contest_type_id': contest['contestType']['contestTypeId'],
-                        'sunday_games': sunday_games,
-                        'non_sunday_games': non_sunday_games,
-                        'is_sunday_afternoon_only_slate': is_sunday_afternoon_only_slate,
-                        'draft_group_id': contest['draftGroupId']
-                    })
-
-        if not millionaire_contests:
+
+        # Kickoff times are only shared within one API response
+        _is_sunday_afternoon_game.cache_clear()
+
+        # Single pass: keep the largest Fantasy Football Millionaire (type 21) slate
+        # made up ONLY of Sunday afternoon games
+        found_millionaire = False
+        main_contest = None
+        game_count = 0
+
+        for contest in data['draftGroups']:
+            contest_type = contest['contestType']
+            if (contest_type['sport'] != 'NFL' or
+                    contest.get('draftGroupState') != 'Upcoming' or
+                    contest_type['contestTypeId'] != 21):
+                continue
+
+            games = contest.get('games', [])
+            if not games:
+                continue
+            found_millionaire = True
+
+            # Slates no larger than the current pick can never replace it
+            if len(games) <= game_count:
+                continue
+
+            # Only consider contests with ONLY Sunday afternoon games (no Sunday Night Football, Monday, Thursday, etc.)
+            # all() stops at the first disqualifying game
+            if all(_is_sunday_afternoon_game(_get_game_start_time(game)) for game in games):
+                main_contest = contest
+                game_count = len(games)
+
+        if not found_millionaire:
             print("❌ No Fantasy Football Millionaire contests found")
             return None
 
-        # Filter to ONLY contests with Sunday afternoon games (12-5 PM ET)
-        sunday_afternoon_only_contests = [c for c in millionaire_contests if c['is_sunday_afternoon_only_slate']]
-
-        if not sunday_afternoon_only_contests:
+        if main_contest is None:
             print("❌ No Sunday afternoon Fantasy Football Millionaire contests found")
             print("💡 All contests include non-afternoon games (Sunday Night Football, Monday Night, etc.)")
             return None
 
-        # Sort Sunday afternoon contests by game count to find the largest (main slate)
-        sorted_contests = sorted(
-            sunday_afternoon_only_contests,
-            key=lambda x: x['game_count'],
-            reverse=True
-        )
-
-        # Select the largest Sunday afternoon slate (the main slate)
-        main_contest_data = sorted_contests[0]
-        main_contest = main_contest_data['contest']
-        game_count = main_contest_data['game_count']
-
         draft_group_id = main_contest['draftGroupId']
         contest_type_id = main_contest['contestType']['contestTypeId']
         csv_url = (
@@ -246,7 +285,11 @@ def get_current_nfl_contest():
         print(f"   📊 {game_count} games (Sunday afternoon)")
         print(f"   🆔 Draft Group: {draft_group_id}")
 
-        return csv_url
+        return {
+            'csv_url': csv_url,
+            'draft_group_id': draft_group_id,
+            'game_count': game_count
+        }
 
     except requests.RequestException as e:
         print(f"❌ Network error fetching NFL contests: {e}")
@@ -256,6 +299,89 @@ def get_current_nfl_contest():
         return None
 
 
+def _load_cached_contest(nfl_week):
+    """
+    Load the cached contest selection if it belongs to the given NFL week.
+
+    Args:
+        nfl_week (int): NFL week the cached contest must match
+
+    Returns:
+        dict or None: Cached contest info, or None if missing, stale, or unreadable
+    """
+    try:
+        with open(CONTEST_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get('nfl_week') != nfl_week:
+        return None
+    if time.time() - cached.get('fetched_at', 0) > CONTEST_CACHE_MAX_AGE:
+        return None
+    if not cached.get('csv_url'):
+        return None
+    if cached.get('game_count', 0) < MAIN_SLATE_MIN_GAMES:
+        return None
+
+    return cached
+
+
+def _save_cached_contest(contest_info, nfl_week):
+    """
+    Persist the selected contest so same-week runs can skip the API call.
+
+    Args:
+        contest_info (dict): Contest info returned by _fetch_current_nfl_contest
+        nfl_week (int): NFL week the contest was selected for
+    """
+    # Pinning a small early slate for the week would hide the main slate once DK posts it
+    if contest_info['game_count'] < MAIN_SLATE_MIN_GAMES:
+        print(f"💡 Not caching a {contest_info['game_count']}-game slate; the main slate may not be posted yet")
+        return
+
+    cached = dict(contest_info, nfl_week=nfl_week, fetched_at=time.time())
+
+    try:
+        CONTEST_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CONTEST_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cached, f, indent=2)
+    except OSError as e:
+        print(f"⚠️  Could not cache contest selection: {e}")
+
+
+def get_current_nfl_contest(refresh=False):
+    """
+    Get the CSV URL for the current week's main Sunday afternoon slate.
+
+    Contest selection only changes weekly, so the result is cached per NFL week
+    and reused by later runs in the same week. Slates under MAIN_SLATE_MIN_GAMES
+    games are never cached, so an early run can't pin a secondary slate.
+
+    Args:
+        refresh (bool): If True, ignore the cache and query the DraftKings API
+
+    Returns:
+        str or None: CSV download URL for the Sunday afternoon Millionaire contest, or None if not found
+    """
+    nfl_week = get_current_nfl_week()
+
+    if not refresh:
+        cached = _load_cached_contest(nfl_week)
+        if cached:
+            print(f"♻️  Using cached Week {nfl_week} contest (use --refresh-contest to refetch)")
+            print(f"   📊 {cached.get('game_count', '?')} games (Sunday afternoon)")
+            print(f"   🆔 Draft Group: {cached.get('draft_group_id', '?')}")
+            return cached['csv_url']
+
+    contest_info = _fetch_current_nfl_contest()
+    if not contest_info:
+        return None
+
+    _save_cached_contest(contest_info, nfl_week)
+    return contest_info['csv_url']
+
+
 def test_direct_download(csv_url):
     """
     Test if CSV can be downloaded directly (usually requires authentication).
@@ -271,32 +397,39 @@ def test_direct_download(csv_url):
     """
     print("🔄 Testing direct download (usually requires authentication)...")
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
-
     try:
-        response = requests.get(csv_url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        with _SESSION.get(csv_url, timeout=DEFAULT_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                print(f"⚠️  Direct download failed (HTTP {response.status_code})")
+                return False
 
-        if response.status_code == 200:
-            # Check if we got locked/placeholder data
-            if "(LOCKED)" in response.text:
+            # Locked/placeholder data shows up in the first rows, so only a short prefix is checked
+            chunks = response.iter_content(chunk_size=CSV_CHUNK_SIZE)
+            first_chunk = next(chunks, b'')
+            if first_chunk.find(LOCKED_MARKER, 0, LOCKED_SCAN_SIZE) != -1:
                 print("⚠️  Direct download returned locked data - authentication required")
                 return False
-            else:
-                # Real data - save it
-                downloads_dir = Path.home() / "Downloads"
-                filepath = get_unique_filename(downloads_dir, DEFAULT_CSV_FILENAME)
-
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(response.text)
-
-                print(f"✅ Success! Real salary data downloaded")
-                print(f"📁 Saved to: {filepath}")
-                return True
-        else:
-            print(f"⚠️  Direct download failed (HTTP {response.status_code})")
-            return False
+
+            # Real data - stream it to disk without decoding
+            downloads_dir = Path.home() / "Downloads"
+            filepath = get_unique_filename(downloads_dir, DEFAULT_CSV_FILENAME)
+
+            # Stream into a non-.csv temp name and swap it in once complete, so a
+            # transfer that dies midway never leaves a truncated salary CSV behind
+            partial_path = filepath.with_name(filepath.name + ".part")
+            try:
+                with open(partial_path, 'wb', buffering=CSV_CHUNK_SIZE) as f:
+                    f.write(first_chunk)
+                    for chunk in chunks:
+                        f.write(chunk)
+                os.replace(partial_path, filepath)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
+
+        print(f"✅ Success! Real salary data downloaded")
+        print(f"📁 Saved to: {filepath}")
+        return True
 
     except (requests.RequestException, IOError, OSError) as e:
         print(f"⚠️  Direct download failed: {e}")
@@ -316,6 +449,10 @@ def open_in_browser(csv_url):
     Returns:
         bool: True if browser opened successfully, False otherwise
     """
+    # Only needed when direct download fails; subprocess and webbrowser stay at
+    # module level since scraper_common already imports them at load time
+    import platform
+
     print("\n🌐 Opening CSV URL in your default browser...")
 
     try:
@@ -344,7 +481,7 @@ def open_in_browser(csv_url):
                 subprocess.run([
                     'osascript', '-e',
                     'tell application "System Events" to tell process of (get name of first application process whose frontmost is true) to keystroke "w" using command down'
-                ], check=False, capture_output=True)
+                ], check=False, capture_output=True, timeout=APPLESCRIPT_TIMEOUT)
             elif system == 'windows':
                 # Windows: Use Alt+F4 to close active window
                 import pyautogui
@@ -360,6 +497,9 @@ def open_in_browser(csv_url):
         except ImportError:
             print("⚠️  pyautogui not available for non-macOS platforms")
             print("💡 You can close the browser window manually")
+        except subprocess.TimeoutExpired:
+            print(f"⏰ Closing browser window timed out after {APPLESCRIPT_TIMEOUT} seconds")
+            print("💡 You can close the browser window manually")
         except (OSError, subprocess.SubprocessError) as e:
             print(f"⚠️  Could not close browser window automatically: {e}")
             print("💡 You can close the browser window manually")
@@ -385,7 +525,8 @@ def main():
     print("="*50)
 
     # Step 1: Get the current contest URL
-    csv_url = get_current_nfl_contest()
+    refresh_contest = "--refresh-contest" in sys.argv
+    csv_url = get_current_nfl_contest(refresh=refresh_contest)
     if not csv_url:
         print("❌ Could not find current NFL contest")
         return False
@@ -12,19 +12,19 @@ Usage:
 """
 
 import sys
-import time
-import webbrowser
 from pathlib import Path
 
 # Add utils to path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent / 'utils'))
 from scraper_common import (
-    check_downloads, close_arc_tab, simple_manual_approach,
-    BROWSER_WAIT_TIME, FILE_CHECK_TIMEOUT
+    check_downloads, close_arc_tab, open_arc_url, simple_manual_approach, wait_for_new_download,
+    DOWNLOAD_WAIT_TIMEOUT
 )
 
 # Configuration constants
 FANTASY_FOOTBALLERS_URL = "https://www.thefantasyfootballers.com/2025-ultimate-dfs-pass/dfs-pass-lineup-optimizer/"
+PROJECTIONS_SIGNATURE = "ProjPts"  # Header column identifying a projections CSV
+AUTO_SKIP_WAIT = 2  # Seconds to poll for a download in auto-skip mode
 
 
 def main():
@@ -44,8 +44,7 @@ def main():
     initial_files = check_downloads()
 
     print("🌐 Opening optimizer in Arc...")
-    webbrowser.open(FANTASY_FOOTBALLERS_URL)
-    time.sleep(BROWSER_WAIT_TIME)
+    open_arc_url(FANTASY_FOOTBALLERS_URL)
 
     # Check for auto-skip mode (for automated workflows)
     auto_skip = "--auto-skip" in sys.argv
@@ -55,7 +54,6 @@ def main():
         print("⚠️  Manual interaction required but running in auto-skip mode")
         print(f"   → Page was: {FANTASY_FOOTBALLERS_URL}")
         manual_worked = False
-        time.sleep(2)  # Brief wait in auto-skip mode
     else:
         instructions = [
             "Page is open in Arc",
@@ -64,38 +62,26 @@ def main():
         ]
         manual_worked = simple_manual_approach(instructions)
 
-    close_arc_tab("Arc tab")
+    close_arc_tab("Arc tab", FANTASY_FOOTBALLERS_URL)
 
-    # Check for new files
+    # Poll for new files, returning as soon as a CSV with the projections header lands;
+    # other new CSVs are ignored rather than counted as the download
     if manual_worked:
         print("   ⏳ Waiting for download to complete...")
-        time.sleep(FILE_CHECK_TIMEOUT)
+        timeout = DOWNLOAD_WAIT_TIMEOUT
     else:
-        time.sleep(2)  # Brief wait in auto-skip mode
+        timeout = AUTO_SKIP_WAIT  # Brief wait in auto-skip mode
 
-    final_files = check_downloads()
-    new_files = [f for f in final_files if f not in initial_files]
+    new_files = wait_for_new_download(initial_files, timeout, signature=PROJECTIONS_SIGNATURE)
 
     if new_files:
         latest_file = new_files[0]
         print(f"✅ SUCCESS! Downloaded: {latest_file.name}")
-
-        # Quick content check
-        try:
-            content = latest_file.read_text(encoding='utf-8')[:200]
-            if 'ProjPts' in content:
-                print("🎯 Confirmed: Projections data!")
-            elif 'DraftKings' in content:
-                print("⚠️  This looks like DraftKings data, not projections")
-            else:
-                print("💡 File downloaded - please verify content")
-        except:
-            print("💡 File downloaded - couldn't verify content")
-
+        print("🎯 Confirmed: Projections data!")
         return True
     else:
         if manual_worked:
-            print("❌ Manual process completed but no download detected")
+            print(f"❌ Manual process completed but no CSV with a '{PROJECTIONS_SIGNATURE}' header was detected")
         else:
             print("❌ Skipped in auto-skip mode")
         return False
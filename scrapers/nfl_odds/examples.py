@@ -10,12 +10,12 @@ from pathlib import Path
 
 from nfl_odds_scraper import NFLOddsScraper
 
-def example_basic_usage():
+def example_basic_usage(scraper=None):
     """Basic usage example"""
     print("📋 Example 1: Basic Usage")
     print("-" * 30)
 
-    scraper = NFLOddsScraper()
+    scraper = scraper or NFLOddsScraper()
 
     # Scrape current week (Week 1)
     result = scraper.scrape_week(week=1, verbose=True)
@@ -25,24 +25,26 @@ def example_basic_usage():
     else:
         print("❌ Failed to scrape data")
 
-def example_multiple_weeks():
-    """Scrape multiple weeks"""
+def example_multiple_weeks(scraper=None):
+    """Scrape multiple weeks in parallel"""
     print("\n📋 Example 2: Multiple Weeks")
     print("-" * 30)
 
-    scraper = NFLOddsScraper()
+    scraper = scraper or NFLOddsScraper()
 
     weeks = [1, 2, 3, 4, 5]  # First 5 weeks
 
-    for week in weeks:
-        print(f"\nScraping Week {week}...")
-        result = scraper.scrape_week(week=week)
+    # scrape_weeks fetches concurrently but reports each week in order
+    print(f"\nScraping Weeks {weeks[0]}-{weeks[-1]} in parallel...")
+    results = scraper.scrape_weeks([(week, None) for week in weeks])
+
+    for week, result in zip(weeks, results):
         if result:
             print(f"✅ Week {week} saved")
         else:
             print(f"❌ Week {week} failed")
 
-def example_custom_directory():
+def example_custom_directory(scraper=None):
     """Use custom output directory"""
     print("\n📋 Example 3: Custom Directory")
     print("-" * 30)
@@ -50,18 +52,19 @@ def example_custom_directory():
     custom_dir = Path.home() / "nfl_odds_data"
     custom_dir.mkdir(exist_ok=True)
 
-    scraper = NFLOddsScraper(output_dir=custom_dir)
+    # Reuse the shared connection pool; only the output directory differs
+    custom_scraper = NFLOddsScraper(output_dir=custom_dir, session=scraper.session if scraper else None)
 
-    result = scraper.scrape_week(week=1)
+    result = custom_scraper.scrape_week(week=1)
     if result:
         print(f"✅ File saved to custom directory: {result}")
 
-def example_different_season():
+def example_different_season(scraper=None):
     """Scrape data from a different season"""
     print("\n📋 Example 4: Different Season")
     print("-" * 30)
 
-    scraper = NFLOddsScraper()
+    scraper = scraper or NFLOddsScraper()
 
     # Scrape Week 10 of 2024 season
     result = scraper.scrape_week(week=10, season=2024, verbose=True)
@@ -71,12 +74,12 @@ def example_different_season():
     else:
         print("❌ No data available for that season/week")
 
-def example_programmatic_access():
+def example_programmatic_access(scraper=None):
     """Access data programmatically without saving"""
     print("\n📋 Example 5: Programmatic Access")
     print("-" * 30)
 
-    scraper = NFLOddsScraper()
+    scraper = scraper or NFLOddsScraper()
 
     raw_data = scraper.fetch_odds_data(week=1)
     if raw_data:
@@ -85,32 +88,48 @@ def example_programmatic_access():
         # Parse just the odds
         odds_data = scraper.parse_draftkings_odds(raw_data)
 
-        # Process the data however you want
-        favorites = [team for team in odds_data if team['moneyline'].startswith('-')]
-        underdogs = [team for team in odds_data if team['moneyline'].startswith('+')]
-
-        print(f"📊 Found {len(favorites)} favorites and {len(underdogs)} underdogs")
+        # Process the data however you want - one pass tracks counts and extremes
+        favorite_count = underdog_count = 0
+        biggest_favorite = biggest_underdog = None  # (moneyline, team entry)
+
+        for team in odds_data:
+            moneyline = team['moneyline']
+            if moneyline.startswith('-'):
+                favorite_count += 1
+                value = int(moneyline)
+                if biggest_favorite is None or value < biggest_favorite[0]:
+                    biggest_favorite = (value, team)
+            elif moneyline.startswith('+'):
+                underdog_count += 1
+                value = int(moneyline)
+                if biggest_underdog is None or value > biggest_underdog[0]:
+                    biggest_underdog = (value, team)
+
+        print(f"📊 Found {favorite_count} favorites and {underdog_count} underdogs")
 
         # Show biggest favorite and underdog
-        if favorites:
-            biggest_favorite = min(favorites, key=lambda x: int(x['moneyline']))
-            print(f"🏆 Biggest favorite: {biggest_favorite['team']} ({biggest_favorite['moneyline']})")
+        if biggest_favorite:
+            team = biggest_favorite[1]
+            print(f"🏆 Biggest favorite: {team['team']} ({team['moneyline']})")
 
-        if underdogs:
-            biggest_underdog = max(underdogs, key=lambda x: int(x['moneyline'].replace('+', '')))
-            print(f"🎯 Biggest underdog: {biggest_underdog['team']} ({biggest_underdog['moneyline']})")
+        if biggest_underdog:
+            team = biggest_underdog[1]
+            print(f"🎯 Biggest underdog: {team['team']} ({team['moneyline']})")
 
 def run_all_examples():
     """Run all examples"""
     print("🏈 NFL ODDS SCRAPER - USAGE EXAMPLES")
     print("=" * 50)
 
+    # One scraper for every example so they share its connection pool
+    scraper = NFLOddsScraper()
+
     try:
-        example_basic_usage()
-        example_multiple_weeks()
-        example_custom_directory()
-        example_different_season()
-        example_programmatic_access()
+        example_basic_usage(scraper)
+        example_multiple_weeks(scraper)
+        example_custom_directory(scraper)
+        example_different_season(scraper)
+        example_programmatic_access(scraper)
 
         print(f"\n🎉 All examples completed!")
         print(f"📂 Check your Downloads folder for CSV files")
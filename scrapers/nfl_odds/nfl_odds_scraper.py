@@ -6,15 +6,26 @@ Configurable for any NFL week, extracts real-time odds data
 """
 
 import argparse
+import csv
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import requests
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional faster JSON decoder
+except ImportError:
+    orjson = None
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.config import get_scraper_settings
-from utils.scraper_common import get_current_nfl_week
+from utils.scraper_common import NFL_ODDS_CSV_PREFIX, get_current_nfl_week
+from utils.scraper_runner import SCRAPER_NOTICE_MARKER
 
 config = get_scraper_settings("nfl_odds")
 ROTOWIRE_BASE_URL = config["rotowire_base_url"]
@@ -22,6 +33,66 @@ DEFAULT_TIMEOUT = config["default_timeout"]
 CONTENT_SAMPLE_SIZE = config["content_sample_size"]
 MIN_NFL_WEEK = config["min_nfl_week"]
 MAX_NFL_WEEK = config["max_nfl_week"]
+DEFAULT_BATCH_CONCURRENCY = 10  # Concurrent Rotowire requests when scraping many weeks
+RESPONSE_CACHE_DIR = Path.home() / ".cache" / "dfs" / "rotowire"
+GAME_DAY_CACHE_TTL = 10  # Seconds a cached response stays fresh on game days
+OFF_DAY_CACHE_TTL = 300  # Seconds a cached response stays fresh on other days
+MAX_STALE_CACHE_AGE = 6 * 3600  # Oldest cached response used when a fresh fetch fails
+GAME_DAYS = (0, 3, 6)  # Monday, Thursday and Sunday
+DEFAULT_SEASON_TTL = 3600  # Seconds before the cached default season is recomputed
+CSV_WRITE_BUFFER_SIZE = 64 * 1024  # Bytes buffered before each CSV write syscall
+ROTOWIRE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/javascript, */*; q=0.01',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Referer': 'https://www.rotowire.com/betting/nfl/odds',
+    'Connection': 'keep-alive'
+}
+CSV_HEADER_ROWS = (
+    ('', '', 'Win', 'Cover', 'Total Points', 'Total Touchdowns', 'Team Points', 'Team TDs', 'Team TDs'),
+    ('Team', 'Date', 'Moneyline', 'Spread', 'Over-Under', 'Over-Under', 'Over-Under', 'Over-Under', 'Over-Under'),
+)
+
+def _decode_json(content):
+    """Decode a JSON response body, using orjson when it is installed."""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+_default_season_cache = {'season': None, 'computed_at': 0.0}
+
+def _default_season():
+    """
+    Get the default NFL season (the current year), cached for DEFAULT_SEASON_TTL seconds.
+
+    The TTL keeps long-running processes correct across a New Year boundary.
+
+    Returns:
+        int: Current calendar year
+    """
+    now = time.monotonic()
+    if (_default_season_cache['season'] is None or
+            now - _default_season_cache['computed_at'] > DEFAULT_SEASON_TTL):
+        _default_season_cache['season'] = datetime.now().year
+        _default_season_cache['computed_at'] = now
+    return _default_season_cache['season']
+
+def _format_signed(value, number_type):
+    """
+    Format a moneyline or spread with an explicit +/- sign.
+
+    Args:
+        value (str, int or float): Raw value from the API
+        number_type (type): int for moneylines, float for spreads
+
+    Returns:
+        str: Signed value, the raw value as text if it is not numeric, or "" if empty
+    """
+    if not value:
+        return ""
+    try:
+        number = number_type(value)
+    except (ValueError, TypeError):
+        return str(value)
+    return f"+{number}" if number > 0 else str(number)
 
 class NFLOddsScraper:
     """
@@ -31,9 +102,29 @@ class NFLOddsScraper:
     for any NFL week and saves the data in CSV format.
     """
 
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, cache_ttl=None, use_cache=True, session=None):
         self.output_dir = Path(output_dir) if output_dir else Path.home() / "Downloads"
         self.base_url = "https://www.rotowire.com/betting/nfl/tables/nfl-games-by-market.php"
+        # Scrapers can share one pooled session; a new one is only built when none is given
+        self.session = session if session is not None else self._create_session()
+        self.cache_ttl = cache_ttl  # None picks a game-day/off-day TTL per lookup
+        self.use_cache = use_cache
+
+    def _create_session(self):
+        """
+        Create a pooled HTTP session for Rotowire requests.
+
+        Keeps TLS connections alive across calls and retries transient failures.
+
+        Returns:
+            requests.Session: Session with default headers and retrying adapter mounted
+        """
+        session = requests.Session()
+        session.headers.update(ROTOWIRE_HEADERS)
+
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        return session
 
     def fetch_odds_data(self, week=1, season=None):
         """
@@ -47,36 +138,114 @@ class NFLOddsScraper:
             dict or None: JSON response from API, or None if request failed
         """
         if season is None:
-            season = datetime.now().year
+            season = _default_season()
 
         params = {
             'week': str(week),
             'season': str(season)
         }
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/javascript, */*; q=0.01',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Referer': 'https://www.rotowire.com/betting/nfl/odds',
-            'Connection': 'keep-alive'
-        }
+        cached = self._load_cached_response(week, season) if self.use_cache else None
+        if cached and cached['age'] <= self._get_cache_ttl():
+            print(f"♻️  Using cached NFL Week {week} odds ({int(cached['age'])}s old)")
+            return cached['data']
 
         try:
             print(f"🔍 Fetching NFL Week {week} odds from Rotowire...")
-            response = requests.get(self.base_url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
+            response = self.session.get(self.base_url, params=params, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
 
-            print(f"✅ Response received: {len(response.text)} characters")
-            return response.json()
+            # Decode straight from bytes to skip requests' text decoding step
+            content = response.content
+            print(f"✅ Response received: {len(content)} bytes")
+            data = _decode_json(content)
 
         except requests.RequestException as e:
             print(f"❌ Error fetching data: {e}")
-            return None
+            return self._stale_fallback(cached, week)
         except json.JSONDecodeError as e:
             print(f"❌ Error parsing JSON: {e}")
+            return self._stale_fallback(cached, week)
+
+        if self.use_cache:
+            self._save_cached_response(week, season, data)
+        return data
+
+    def _get_cache_ttl(self):
+        """
+        Get how long a cached response stays fresh.
+
+        Returns:
+            int: Configured TTL, or a shorter TTL on game days when lines move quickly
+        """
+        if self.cache_ttl is not None:
+            return self.cache_ttl
+        return GAME_DAY_CACHE_TTL if datetime.now().weekday() in GAME_DAYS else OFF_DAY_CACHE_TTL
+
+    def _get_cache_path(self, week, season):
+        """Get the cache file path for a week and season."""
+        return RESPONSE_CACHE_DIR / f"{season}_week{week}.json"
+
+    def _load_cached_response(self, week, season):
+        """
+        Load a cached Rotowire response regardless of freshness.
+
+        Args:
+            week (int): NFL week number
+            season (int): NFL season year
+
+        Returns:
+            dict or None: {'data', 'age'} for the cached response, or None if unavailable
+        """
+        try:
+            with open(self._get_cache_path(week, season), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return {'data': cached['data'], 'age': time.time() - cached['fetched_at']}
+        except (OSError, ValueError, KeyError, TypeError):
             return None
 
+    def _save_cached_response(self, week, season, data):
+        """
+        Persist a Rotowire response for later runs.
+
+        Args:
+            week (int): NFL week number
+            season (int): NFL season year
+            data (list): Parsed JSON response
+        """
+        try:
+            RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._get_cache_path(week, season), 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': time.time(), 'data': data}, f)
+        except OSError as e:
+            print(f"⚠️  Could not cache odds response: {e}")
+
+    def _stale_fallback(self, cached, week):
+        """
+        Return a stale cached response when a fresh fetch fails.
+
+        The warning goes to stderr with SCRAPER_NOTICE_MARKER so the workflow
+        runner, which discards stdout, still shows it.
+
+        Args:
+            cached (dict or None): Result of _load_cached_response
+            week (int): NFL week number (for logging)
+
+        Returns:
+            list or None: Cached response data, or None if nothing usable is cached
+        """
+        if not cached:
+            return None
+
+        if cached['age'] > MAX_STALE_CACHE_AGE:
+            print(f"{SCRAPER_NOTICE_MARKER}⚠️  Cached NFL Week {week} odds are too old to use "
+                  f"({int(cached['age'])}s old)", file=sys.stderr)
+            return None
+
+        print(f"{SCRAPER_NOTICE_MARKER}⚠️  Using stale cached NFL Week {week} odds after a failed fetch "
+              f"({int(cached['age'])}s old)", file=sys.stderr)
+        return cached['data']
+
     def parse_draftkings_odds(self, data):
         """
         Parse DraftKings odds from the API response.
@@ -92,84 +261,39 @@ class NFLOddsScraper:
         if not data:
             return []
 
-        odds_data = []
-
-        for game in data:
-            try:
-                # Extract basic game info
-                team_name = game.get('nickname', '')
-                game_date = game.get('gameDate', '')
-                home_away = game.get('homeAway', '')
-                abbr = game.get('abbr', '')
-
-                # Extract DraftKings odds
-                dk_moneyline = game.get('draftkings_moneyline')
-                dk_spread = game.get('draftkings_spread')
-                dk_ou = game.get('draftkings_ou')
-                dk_team_total_over = game.get('draftkings_teamTotalOver')
-
-                # Skip if no DraftKings data
-                if not any([dk_moneyline, dk_spread, dk_ou]):
-                    continue
-
-                formatted_moneyline = self._format_moneyline(dk_moneyline)
-                formatted_spread = self._format_spread(dk_spread)
-                team_points = str(dk_team_total_over) if dk_team_total_over else ""
-
-                odds_entry = {
-                    'team': team_name,
-                    'date': game_date,
-                    'moneyline': formatted_moneyline,
-                    'spread': formatted_spread,
-                    'total': str(dk_ou) if dk_ou else "",
-                    'team_points': team_points,
-                    'home_away': home_away,
-                    'abbr': abbr
-                }
-
-                odds_data.append(odds_entry)
-
-            except Exception as e:
-                print(f"❌ Error processing game: {e}")
-                continue
-
-        return odds_data
+        return [entry for entry in map(self._build_odds_entry, data) if entry]
 
-    def _format_moneyline(self, moneyline):
+    def _build_odds_entry(self, game):
         """
-        Format moneyline with proper +/- signs.
+        Build a formatted odds entry for one team from the API response.
 
         Args:
-            moneyline (str or int): Raw moneyline value
+            game (dict): Single team entry from the Rotowire API response
 
         Returns:
-            str: Formatted moneyline with proper +/- prefix
-        """
-        if not moneyline:
-            return ""
-        try:
-            ml = int(moneyline)
-            return f"+{ml}" if ml > 0 else str(ml)
-        except (ValueError, TypeError):
-            return str(moneyline) if moneyline else ""
-
-    def _format_spread(self, spread):
+            dict or None: Formatted odds entry, or None if the team has no DraftKings odds
         """
-        Format spread with proper +/- signs.
+        # Extract DraftKings odds
+        dk_moneyline = game.get('draftkings_moneyline')
+        dk_spread = game.get('draftkings_spread')
+        dk_ou = game.get('draftkings_ou')
 
-        Args:
-            spread (str or float): Raw spread value
+        # Skip if no DraftKings data
+        if not (dk_moneyline or dk_spread or dk_ou):
+            return None
 
-        Returns:
-            str: Formatted spread with proper +/- prefix
-        """
-        if not spread:
-            return ""
-        try:
-            sp = float(spread)
-            return f"+{sp}" if sp > 0 else str(sp)
-        except (ValueError, TypeError):
-            return str(spread) if spread else ""
+        dk_team_total_over = game.get('draftkings_teamTotalOver')
+
+        return {
+            'team': game.get('nickname', ''),
+            'date': game.get('gameDate', ''),
+            'moneyline': _format_signed(dk_moneyline, int),
+            'spread': _format_signed(dk_spread, float),
+            'total': str(dk_ou) if dk_ou else "",
+            'team_points': str(dk_team_total_over) if dk_team_total_over else "",
+            'home_away': game.get('homeAway', ''),
+            'abbr': game.get('abbr', '')
+        }
 
     def save_to_csv(self, odds_data, week, season=None):
         """
@@ -184,27 +308,25 @@ class NFLOddsScraper:
             str or None: Path to saved CSV file, or None if save failed
         """
         if season is None:
-            season = datetime.now().year
+            season = _default_season()
 
-        filename = self.output_dir / f"NFL_Odds_Week_{week}_{season}_DraftKings.csv"
+        filename = self.output_dir / f"{NFL_ODDS_CSV_PREFIX}Week_{week}_{season}_DraftKings.csv"
 
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            rows = [
+                (data.get('team', ''), data.get('date', ''), data.get('moneyline', ''),
+                 data.get('spread', ''), data.get('total', ''), '', data.get('team_points', ''), '', '')
+                for data in odds_data
+            ]
+
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile, lineterminator='\n')
+
                 # Write header matching required format
-                csvfile.write(',,Win,Cover,Total Points,Total Touchdowns,Team Points,Team TDs,Team TDs\n')
-                csvfile.write('Team,Date,Moneyline,Spread,Over-Under,Over-Under,Over-Under,Over-Under,Over-Under\n')
+                writer.writerows(CSV_HEADER_ROWS)
 
                 # Write data rows
-                for data in odds_data:
-                    team = data.get('team', '')
-                    date = data.get('date', '')
-                    moneyline = data.get('moneyline', '')
-                    spread = data.get('spread', '')
-                    total = data.get('total', '')
-                    team_points = data.get('team_points', '')
-
-                    row = f"{team},{date},{moneyline},{spread},{total},,{team_points},,\n"
-                    csvfile.write(row)
+                writer.writerows(rows)
 
             print(f"✅ Odds data saved to: {filename}")
             return str(filename)
@@ -228,7 +350,7 @@ class NFLOddsScraper:
             str or None: Path to saved CSV file, or None if scrape failed
         """
         if season is None:
-            season = datetime.now().year
+            season = _default_season()
 
         print(f"🏈 NFL ODDS SCRAPER - Week {week}, {season} Season")
         print("=" * 50)
@@ -262,6 +384,76 @@ class NFLOddsScraper:
             print("❌ No DraftKings odds data found")
             return None
 
+    def scrape_weeks(self, jobs, concurrency=DEFAULT_BATCH_CONCURRENCY):
+        """
+        Scrape odds for many (week, season) pairs with concurrent requests.
+
+        Fetches run in parallel over the shared session; parsing and CSV
+        writes then happen sequentially in job order.
+
+        Args:
+            jobs (list): List of (week, season) tuples to scrape; a season of None
+                means the current season
+            concurrency (int): Maximum number of requests in flight at once
+
+        Returns:
+            list: Saved CSV path (or None on failure) for each job, in job order
+        """
+        if not jobs:
+            return []
+
+        jobs = [(week, _default_season() if season is None else season) for week, season in jobs]
+
+        print(f"🏈 NFL ODDS SCRAPER - {len(jobs)} week(s), up to {concurrency} at a time")
+        print("=" * 50)
+
+        # The odds endpoint is only known to serve one week per request, so
+        # multi-week runs stay one fetch per week rather than a season-wide call
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+            raw_results = list(executor.map(lambda job: self.fetch_odds_data(*job), jobs))
+
+        output_files = []
+        for (week, season), raw_data in zip(jobs, raw_results):
+            odds_data = self.parse_draftkings_odds(raw_data)
+            if not odds_data:
+                print(f"❌ Week {week}, {season}: No DraftKings odds data found")
+                output_files.append(None)
+                continue
+
+            output_files.append(self.save_to_csv(odds_data, week, season))
+
+        saved = sum(1 for output_file in output_files if output_file)
+        print(f"\n🎯 Completed: {saved}/{len(jobs)} weeks saved")
+        return output_files
+
+def parse_week_range(value):
+    """
+    Parse a week selection such as "1-18" or "1,3,5" into a list of weeks.
+
+    Args:
+        value (str): Week range and/or comma-separated week numbers
+
+    Returns:
+        list: Sorted unique week numbers
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is malformed or out of range
+    """
+    weeks = set()
+    try:
+        for part in value.split(','):
+            start, _, end = part.partition('-')
+            first = int(start)
+            last = int(end) if end else first
+            weeks.update(range(first, last + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid week selection: {value}")
+
+    if not weeks or min(weeks) < MIN_NFL_WEEK or max(weeks) > MAX_NFL_WEEK:
+        raise argparse.ArgumentTypeError(f"Weeks must be between {MIN_NFL_WEEK} and {MAX_NFL_WEEK}")
+
+    return sorted(weeks)
+
 def main():
     """
     Command line interface for the NFL odds scraper.
@@ -271,25 +463,30 @@ def main():
     """
 
     parser = argparse.ArgumentParser(description='Scrape NFL DraftKings odds from Rotowire')
-    parser.add_argument('--week', '-w', type=int, default=None, help='NFL week (1-18, defaults to current week)')
+    parser.add_argument('--week', '-w', type=int, default=None, choices=range(MIN_NFL_WEEK, MAX_NFL_WEEK + 1),
+                        metavar='WEEK', help='NFL week (1-18, defaults to current week)')
+    parser.add_argument('--weeks', type=parse_week_range,
+                        help='Scrape several weeks concurrently, e.g. "1-18" or "1,3,5"')
     parser.add_argument('--season', '-s', type=int, help='NFL season year (default: current year)')
     parser.add_argument('--output-dir', '-o', help='Output directory (default: ~/Downloads)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--no-cache', action='store_true', help='Always fetch fresh odds from Rotowire')
 
     args = parser.parse_args()
 
+    if args.weeks:
+        season = args.season if args.season is not None else _default_season()
+        scraper = NFLOddsScraper(output_dir=args.output_dir, use_cache=not args.no_cache)
+        scraper.scrape_weeks([(week, season) for week in args.weeks])
+        return
+
     # Use current week if not specified
     week = args.week if args.week is not None else get_current_nfl_week()
 
-    # Validate week
-    if not MIN_NFL_WEEK <= week <= MAX_NFL_WEEK:
-        print(f"❌ Week must be between {MIN_NFL_WEEK} and {MAX_NFL_WEEK}")
-        return
-
     if args.week is None:
         print(f"🏈 Using auto-detected NFL Week {week}")
 
-    scraper = NFLOddsScraper(output_dir=args.output_dir)
+    scraper = NFLOddsScraper(output_dir=args.output_dir, use_cache=not args.no_cache)
 
     # Scrape the specified week
     result = scraper.scrape_week(
@@ -15,47 +15,57 @@ Usage:
     python3 scraper.py [--week WEEK] [--auto-skip]
 """
 
-import argparse
 import sys
-import time
-import webbrowser
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Add utils to path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent / 'utils'))
 from scraper_common import (
-    check_downloads, close_arc_tab, simple_manual_approach,
-    BROWSER_WAIT_TIME, FILE_CHECK_TIMEOUT, get_current_nfl_week
+    check_downloads, close_arc_tab, open_arc_url, simple_manual_approach, wait_for_new_download,
+    DomainRateLimiter, DOWNLOAD_WAIT_TIMEOUT, get_current_nfl_week
 )
 
 # Configuration constants
-BROWSER_AUTOMATION_DELAY = 1  # Seconds between automation attempts
+BROWSER_AUTOMATION_DELAY = 1  # Minimum seconds between page opens on the SOS site
 SOS_BASE_URL = "https://www.thefantasyfootballers.com/footclan/strength-of-schedule/"
+AUTO_SKIP_WAIT = 2  # Seconds to poll for a download in auto-skip mode
+
+# Position configurations as (display name, URL code) pairs, in scrape order
+POSITIONS = (
+    ('QB', 'QB'),
+    ('RB', 'RB'),
+    ('WR', 'WR'),
+    ('TE', 'TE'),
+    ('D/ST', 'D'),
+)
+
+# Page URL for each position code, built once at import
+POSITION_URLS = {code: f"{SOS_BASE_URL}?position={code}" for _, code in POSITIONS}
 
-# Position configurations
-POSITIONS = {
-    'QB': 'QB',
-    'RB': 'RB',
-    'WR': 'WR',
-    'TE': 'TE',
-    'D/ST': 'D'
-}
+# Throttles page opens per host; waits only if the previous open was too recent
+_rate_limiter = DomainRateLimiter({urlparse(SOS_BASE_URL).netloc: BROWSER_AUTOMATION_DELAY})
 
 
-def scrape_position(position_name, position_code, week_number, auto_skip=False):
+def scrape_position(position_name, position_code, week_number, auto_skip=False, known_files=None):
     """
     Arc-only flow for a specific position: opens a new page for each position.
+
+    known_files is the Downloads snapshot carried over from the previous
+    position; it is updated in place with this position's download so the
+    next position does not need to rescan.
     """
     print(f"🏈 Scraping {position_name} Strength of Schedule data...")
 
-    url = f"{SOS_BASE_URL}?position={position_code}"
+    url = POSITION_URLS[position_code]
 
-    # Record initial download state
-    initial_files = check_downloads()
+    # Record initial download state (as a set for O(1) membership checks)
+    if known_files is None:
+        known_files = set(check_downloads())
 
     print(f"🌐 Opening SOS page in Arc...")
-    webbrowser.open(url)
-    time.sleep(BROWSER_WAIT_TIME)
+    _rate_limiter.acquire(url)
+    open_arc_url(url)
 
     # Use simple manual approach
     if auto_skip:
@@ -71,15 +81,15 @@ def scrape_position(position_name, position_code, week_number, auto_skip=False):
         ]
         manual_worked = simple_manual_approach(instructions, f"for {position_name}")
 
-    # Check for new files
+    # Wait for the new file instead of sleeping a fixed interval
     if manual_worked:
         print(f"   ⏳ Waiting for {position_name} download to complete...")
-        time.sleep(FILE_CHECK_TIMEOUT)
+        timeout = DOWNLOAD_WAIT_TIMEOUT
     else:
-        time.sleep(2)  # Brief wait in auto-skip mode
+        timeout = AUTO_SKIP_WAIT  # Brief wait in auto-skip mode
 
-    final_files = check_downloads()
-    new_files = [f for f in final_files if f not in initial_files]
+    new_files = wait_for_new_download(known_files, timeout)
+    known_files.update(new_files)
 
     if new_files:
         latest_file = new_files[0]
@@ -91,6 +101,8 @@ def scrape_position(position_name, position_code, week_number, auto_skip=False):
 
         try:
             latest_file.rename(new_path)
+            known_files.discard(latest_file)
+            known_files.add(new_path)
             print(f"✅ {position_name} download successful: {new_name}")
             return True
         except Exception as e:
@@ -113,6 +125,9 @@ def main():
     respective Strength of Schedule CSV files. Uses simple manual approach
     that mirrors Projections scraper.
     """
+    # Only the CLI needs argparse, so importing this module as a library skips it
+    import argparse
+
     parser = argparse.ArgumentParser(description='Download Strength of Schedule data for all positions')
     parser.add_argument('--week', '-w', type=int, default=None,
                         help='NFL week number (1-18, defaults to current week)')
@@ -141,33 +156,32 @@ def main():
         print("💡 Run without --auto-skip to use manual mode instead\n")
 
     results = []
+    known_files = set(check_downloads())  # Snapshot threaded through every position
+
+    last_position = POSITIONS[-1][0]
 
     # Process each position with separate windows
-    for i, (position_name, position_code) in enumerate(POSITIONS.items()):
-        success = scrape_position(position_name, position_code, week, args.auto_skip)
+    for position_name, position_code in POSITIONS:
+        success = scrape_position(position_name, position_code, week, args.auto_skip, known_files)
         results.append((position_name, success))
 
         # In auto-skip mode, continue to next position instead of breaking
         # This allows all positions to be attempted even if manual interaction fails
 
         # Close Arc tab after each position
-        close_arc_tab(f"{position_name} Arc tab")
+        close_arc_tab(f"{position_name} Arc tab", POSITION_URLS[position_code])
 
-        # Add brief delay between positions (except after last)
-        if i < len(POSITIONS) - 1:
-            time.sleep(BROWSER_AUTOMATION_DELAY)
+        # Spacing between positions (except after last); the rate limiter handles pacing
+        if position_name != last_position:
             print()
 
-    print("=" * 60)
-    print("📊 Strength of Schedule Scraping Summary:")
-    successful = 0
-    for position, success in results:
-        status = "✅" if success else "❌"
-        print(f"{status} {position} Strength of Schedule")
-        if success:
-            successful += 1
-
-    print(f"\n🎯 Completed: {successful}/{len(results)} positions successful")
+    # Build the summary up front so it is written in a single call
+    successful = sum(1 for _, success in results if success)
+    summary_lines = ["=" * 60, "📊 Strength of Schedule Scraping Summary:"]
+    summary_lines += [f"{'✅' if success else '❌'} {position} Strength of Schedule"
+                      for position, success in results]
+    summary_lines.append(f"\n🎯 Completed: {successful}/{len(results)} positions successful")
+    print("\n".join(summary_lines), flush=True)
 
     return successful == len(results)
 
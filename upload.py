@@ -6,20 +6,57 @@ Standalone utility for uploading DFS CSV data to Google Sheets.
 
 Usage:
     python3 upload.py
+    python3 upload.py --plan    # Preview the upload without calling the API
+    python3 upload.py --force   # Re-upload every CSV, even unchanged ones
 """
 
+import argparse
 import sys
 from typing import NoReturn
 
-from utils.workflow import upload_to_sheets
+from utils.workflow import plan_upload, upload_to_sheets
+
+
+def print_upload_plan(force: bool = False) -> NoReturn:
+    """Print what an upload would send, computed from local CSVs only."""
+    plan = plan_upload(force)
+    if plan is None:
+        sys.exit(1)
+
+    print("\n📋 Upload Plan:")
+    for tab_name, rows in plan['tabs'].items():
+        print(f"   📤 {tab_name}: ~{rows} rows")
+    for tab_name in plan['skipped']:
+        print(f"   ⏭️  {tab_name}: unchanged since last upload")
+    if not plan['tabs']:
+        print("   ✅ Nothing to upload")
+
+    print(f"\n🎯 Estimated: {plan['estimated_cells']} cells, {plan['estimated_api_calls']} API calls")
+    sys.exit(0)
 
 
 def main() -> NoReturn:
     """Execute the standalone Google Sheets upload workflow."""
+    parser = argparse.ArgumentParser(description='DFS Google Sheets Upload')
+    parser.add_argument(
+        '--plan',
+        action='store_true',
+        help='Show which tabs would be uploaded, without any API calls'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-upload every CSV even if unchanged since its last upload'
+    )
+    args = parser.parse_args()
+
     print("🏈 DFS Google Sheets Upload")
     print("=" * 40)
 
-    success = upload_to_sheets()
+    if args.plan:
+        print_upload_plan(args.force)
+
+    success = upload_to_sheets(force=args.force)
 
     if success:
         print("\n🎉 Upload process completed successfully!")
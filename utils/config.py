@@ -5,16 +5,27 @@ DFS Configuration Management Utilities
 Centralized configuration loading and validation for DFS workflows.
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+try:
+    import orjson  # Optional faster JSON decoder
+except ImportError:
+    orjson = None
+
 # Type aliases for better code documentation
-ScraperConfig = Tuple[Path, str, str]  # (path, script_name, description)
-ScraperConfigList = List[ScraperConfig]
+ScraperConfig = Tuple[Path, str, str, bool]  # (path, script_name, description, concurrent)
+ScraperConfigList = Tuple[ScraperConfig, ...]
 ConfigDict = Dict[str, Union[str, Dict, List]]
 SheetsConfig = Dict[str, Union[str, Dict, None]]
 
+# Project paths, resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH = PROJECT_ROOT / "config.json"
+SCRAPERS_DIR = PROJECT_ROOT / "scrapers"
+
 # Scraper Configuration Constants
 SCRAPER_SETTINGS = {
     "nfl_odds": {
@@ -26,15 +37,32 @@ SCRAPER_SETTINGS = {
     }
 }
 
+# Scraper lists are static, so they are built once and returned as-is
+SCRAPER_CONFIGS: ScraperConfigList = (
+    (SCRAPERS_DIR / "draftkings", "scraper.py", "DraftKings Salaries", False),
+    (SCRAPERS_DIR / "nfl_odds", "nfl_odds_scraper.py", "NFL Odds Data", True),
+    (SCRAPERS_DIR / "tffb_sos", "scraper.py", "Strength of Schedule", False),
+    (SCRAPERS_DIR / "fantasy_footballers", "scraper.py", "Projections", False),
+)
+UPDATE_SCRAPER_CONFIGS: ScraperConfigList = (
+    (SCRAPERS_DIR / "nfl_odds", "nfl_odds_scraper.py", "NFL Odds Data", True),
+    (SCRAPERS_DIR / "fantasy_footballers", "scraper.py", "Projections", False),
+)
+
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Optional[ConfigDict]:
-    """Load and parse the main application configuration from config.json."""
-    project_root = Path(__file__).parent.parent
-    config_path = project_root / "config.json"
+    """Load and parse the main application configuration from config.json.
+
+    The result (including a failed load) is cached for the life of the process;
+    call load_config.cache_clear() to re-read the file.
+    """
+    config_path = CONFIG_PATH
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as config_file:
-            return json.load(config_file)
+        raw_config = config_path.read_bytes()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+        return orjson.loads(raw_config) if orjson else json.loads(raw_config)
     except FileNotFoundError:
         print(f"❌ Configuration file not found: {config_path}")
         print("💡 Ensure config.json exists in the project root directory")
@@ -50,27 +78,17 @@ def load_config() -> Optional[ConfigDict]:
 
 
 def get_scraper_configs() -> ScraperConfigList:
-    """Get the complete configuration for all available DFS scrapers."""
-    project_root = Path(__file__).parent.parent
-    base_dir = project_root / "scrapers"
+    """Get the complete configuration for all available DFS scrapers.
 
-    return [
-        (base_dir / "draftkings", "scraper.py", "DraftKings Salaries"),
-        (base_dir / "nfl_odds", "nfl_odds_scraper.py", "NFL Odds Data"),
-        (base_dir / "tffb_sos", "scraper.py", "Strength of Schedule"),
-        (base_dir / "fantasy_footballers", "scraper.py", "Projections"),
-    ]
+    The trailing flag marks scrapers that are pure HTTP and may run alongside
+    others; browser-driven scrapers share the foreground browser and run serially.
+    """
+    return SCRAPER_CONFIGS
 
 
 def get_update_scrapers() -> ScraperConfigList:
     """Get configuration for frequently updated scrapers only (excludes DraftKings)."""
-    project_root = Path(__file__).parent.parent
-    base_dir = project_root / "scrapers"
-
-    return [
-        (base_dir / "nfl_odds", "nfl_odds_scraper.py", "NFL Odds Data"),
-        (base_dir / "fantasy_footballers", "scraper.py", "Projections"),
-    ]
+    return UPDATE_SCRAPER_CONFIGS
 
 
 def get_scraper_settings(scraper_name: str) -> Dict[str, Union[str, int]]:
@@ -103,24 +121,35 @@ def validate_google_sheets_config(sheets_config: Optional[SheetsConfig]) -> bool
         print("💡 Add 'google_sheets' section to your configuration")
         return False
 
+    return _validate_sheets_settings(sheets_config['sheet_id'], sheets_config['credentials_file'])
+
+
+@functools.lru_cache(maxsize=None)
+def _validate_sheets_settings(sheet_id: str, credentials_file: str) -> bool:
+    """Validate a sheet ID and credentials file, cached per pair for the process lifetime."""
     # Validate sheet ID configuration
-    if sheets_config['sheet_id'] == 'YOUR_SHEET_ID_HERE':
+    if sheet_id == 'YOUR_SHEET_ID_HERE':
         print("❌ Google Sheet ID not configured")
         print("💡 Edit config.json and replace 'YOUR_SHEET_ID_HERE' with your actual Sheet ID")
         return False
 
-    # Validate credentials file existence and accessibility
-    project_root = Path(__file__).parent.parent
-    creds_path = project_root / sheets_config['credentials_file']
-    if not creds_path.exists():
+    # One open() surfaces missing, non-file, and unreadable credentials alike
+    creds_path = PROJECT_ROOT / credentials_file
+    try:
+        with open(creds_path, 'rb') as creds_file:
+            creds_file.read(1)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"❌ Google API credentials file not found: {creds_path}")
         print("💡 Download credentials.json from Google Cloud Console and place in project root")
         return False
-
-    if not creds_path.is_file():
+    except IsADirectoryError:
         print(f"❌ Credentials path exists but is not a file: {creds_path}")
         print("💡 Ensure the credentials path points to a valid JSON file")
         return False
+    except PermissionError:
+        print(f"❌ Permission denied accessing credentials file: {creds_path}")
+        print("💡 Check file permissions and try again")
+        return False
 
     return True
 
@@ -5,9 +5,20 @@ DFS CSV Cleanup Utilities
 Safe cleanup of project CSV files for new analysis periods.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
+# Project-scoped cleanup directories, resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CLEANUP_DIRS = (
+    PROJECT_ROOT / "downloads",
+    PROJECT_ROOT / "downloads" / "draftkings",
+    PROJECT_ROOT / "downloads" / "fantasy_footballers",
+    PROJECT_ROOT / "downloads" / "nfl_odds",
+)
+
 
 def clear_old_csvs() -> bool:
     """Execute cleanup of project CSV files for new analysis period."""
@@ -16,23 +27,13 @@ def clear_old_csvs() -> bool:
     errors: List[str] = []
     total_deleted = 0
 
-    # Define project-scoped cleanup directories
-    project_root = Path(__file__).parent.parent
-    cleanup_dirs = [
-        project_root / "downloads",
-        project_root / "downloads" / "draftkings",
-        project_root / "downloads" / "fantasy_footballers",
-        project_root / "downloads" / "nfl_odds",
-    ]
-
-    # Process each target directory
-    for directory in cleanup_dirs:
-        if not directory.exists():
-            continue
-
-        deleted_count, dir_errors = _cleanup_directory(directory)
-        total_deleted += deleted_count
-        errors.extend(dir_errors)
+    # Process target directories concurrently; each one's unlinks are independent
+    existing_dirs = [directory for directory in CLEANUP_DIRS if directory.exists()]
+    if existing_dirs:
+        with ThreadPoolExecutor(max_workers=len(existing_dirs)) as executor:
+            for deleted_count, dir_errors in executor.map(_cleanup_directory, existing_dirs):
+                total_deleted += deleted_count
+                errors.extend(dir_errors)
 
     # Generate comprehensive summary report
     _print_cleanup_summary(total_deleted, errors)
@@ -46,13 +47,14 @@ def _cleanup_directory(directory: Path) -> Tuple[int, List[str]]:
     errors: List[str] = []
 
     try:
-        csv_files = list(directory.glob("*.csv"))
+        # scandir yields names and paths directly, without a Path object per entry
+        with os.scandir(directory) as entries:
+            csv_files = [entry for entry in entries if entry.name.endswith(".csv") and entry.is_file()]
 
         for csv_file in csv_files:
             try:
-                csv_file.unlink()
+                os.unlink(csv_file.path)
                 deleted_count += 1
-                print(f"   🗑️  Deleted: {csv_file.name}")
             except (OSError, PermissionError) as e:
                 error_msg = f"Could not delete {csv_file.name}: {e}"
                 errors.append(error_msg)
@@ -64,6 +66,10 @@ def _cleanup_directory(directory: Path) -> Tuple[int, List[str]]:
         error_msg = f"Error scanning directory {directory}: {e}"
         errors.append(error_msg)
 
+    # One line per directory rather than one per deleted file
+    if deleted_count:
+        print(f"   🗑️  Deleted {deleted_count} file(s) from {directory.name}/")
+
     return deleted_count, errors
 
 
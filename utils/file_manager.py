@@ -6,10 +6,20 @@ Shared functions for organizing downloaded DFS files.
 Used by run_all.py and run_update.py workflows.
 """
 
-import subprocess
-import sys
+import contextlib
+import io
+import os
 from pathlib import Path
 
+try:
+    # When imported as a module from main scripts
+    from utils import manage_downloads
+except ImportError:
+    # When run directly from utils directory
+    import manage_downloads
+
+DOWNLOADS_DIR = Path(__file__).resolve().parent.parent / "downloads"
+
 def organize_downloads(quiet=False):
     """
     Organize downloaded CSV files into project structure.
@@ -24,30 +34,19 @@ def organize_downloads(quiet=False):
         print("🔄 Organizing downloaded files...")
 
     try:
-        utils_dir = Path(__file__).parent
-        manage_script = utils_dir / "manage_downloads.py"
-        project_root = utils_dir.parent
-
-        # Run the file management script
-        result = subprocess.run([sys.executable, str(manage_script)],
-                              cwd=project_root,
-                              capture_output=quiet,  # Suppress output if quiet
-                              timeout=120)
-
-        success = result.returncode == 0
-
+        # Run the file manager in-process rather than spawning a new interpreter
+        if quiet:
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                manage_downloads.main()
+        else:
+            manage_downloads.main()
+
+        # As with the old script's exit code, finishing without an exception counts as success
         if not quiet:
-            if success:
-                print("✅ Files organized successfully!")
-            else:
-                print("⚠️  File organization had issues")
+            print("✅ Files organized successfully!")
 
-        return success
+        return True
 
-    except subprocess.TimeoutExpired:
-        if not quiet:
-            print("⏰ File organization timed out")
-        return False
     except Exception as e:
         if not quiet:
             print(f"❌ File organization failed: {e}")
@@ -56,10 +55,13 @@ def organize_downloads(quiet=False):
 def show_organization_summary():
     """Show a brief summary of organized files."""
     try:
-        project_root = Path(__file__).parent.parent
-        downloads_dir = project_root / "downloads"
+        downloads_dir = DOWNLOADS_DIR
 
-        if not downloads_dir.exists():
+        # One listing of downloads/ answers every category and manifest existence check
+        try:
+            with os.scandir(downloads_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
             print("📁 No organized files yet")
             return
 
@@ -69,15 +71,24 @@ def show_organization_summary():
 
         for category in categories:
             category_dir = downloads_dir / category
-            if category_dir.exists():
-                csv_files = list(category_dir.glob("*.csv"))
-                latest_files = list(category_dir.glob(f"{category.replace('_', '-')}*_latest.csv"))
-                file_counts[category] = {
-                    'total': len(csv_files),
-                    'has_latest': len(latest_files) > 0
-                }
-            else:
-                file_counts[category] = {'total': 0, 'has_latest': False}
+            latest_prefix = category.replace('_', '-')
+            counts = {'total': 0, 'has_latest': False}
+            file_counts[category] = counts
+
+            if category not in present:
+                continue
+
+            # One scandir pass counts CSVs and spots the latest copy together
+            try:
+                with os.scandir(category_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith('.csv'):
+                            continue
+                        counts['total'] += 1
+                        if entry.name.startswith(latest_prefix) and entry.name.endswith('_latest.csv'):
+                            counts['has_latest'] = True
+            except (FileNotFoundError, NotADirectoryError):
+                pass
 
         print("\n📊 Organized Files Summary:")
         for category, counts in file_counts.items():
@@ -86,9 +97,9 @@ def show_organization_summary():
             print(f"   {status} {name}: {counts['total']} files")
 
         # Check for upload manifest
-        manifest_file = downloads_dir / "upload_manifest.json"
-        manifest_status = "✅" if manifest_file.exists() else "❌"
-        print(f"   {manifest_status} Upload Manifest: {'Ready' if manifest_file.exists() else 'Not found'}")
+        has_manifest = "upload_manifest.json" in present
+        manifest_status = "✅" if has_manifest else "❌"
+        print(f"   {manifest_status} Upload Manifest: {'Ready' if has_manifest else 'Not found'}")
 
     except Exception as e:
         print(f"⚠️  Could not show summary: {e}")
@@ -12,7 +12,10 @@ Usage:
     python3 manage_downloads.py
 """
 
+import functools
 import json
+import os
+import re
 import shutil
 import time
 from datetime import datetime
@@ -20,9 +23,35 @@ from pathlib import Path
 
 # Configuration constants
 DEFAULT_MAX_AGE_MINUTES = 30  # Default time window for recent files
-CONTENT_SAMPLE_SIZE = 500  # Characters to read for content analysis
+CONTENT_SAMPLE_SIZE = 500  # Bytes to read for content analysis
 DEFAULT_SCAN_WINDOW_MINUTES = 60  # Default scan window for main function
 TIMESTAMP_FORMAT = "%Y%m%d_%H%M"  # Format for timestamped filenames
+PROJECT_DIR = Path(__file__).resolve().parent.parent  # Go up one level from utils/
+DOWNLOADS_DIR = PROJECT_DIR / "downloads"
+SOURCE_DIRS = {
+    'projections': DOWNLOADS_DIR / "projections",
+    'draftkings': DOWNLOADS_DIR / "draftkings",
+    'nfl_odds': DOWNLOADS_DIR / "nfl_odds",
+    'sos': DOWNLOADS_DIR / "sos"
+}
+
+# Source identification patterns, checked in priority order against lowercased text.
+# Lookahead pairs at ^ express "both substrings present anywhere".
+CONTENT_SOURCE_PATTERNS = (
+    # SOS patterns (check first since it contains 'fantasy')
+    ('sos', re.compile(r"strength of schedule|^(?=.*opp avg)(?=.*fpa)", re.DOTALL)),
+    ('projections', re.compile(r"projpts|projown|fantasy|footballers")),
+    ('draftkings', re.compile(r"draftkings|salary|roster position")),
+    ('nfl_odds', re.compile(r"spread|moneyline|^(?=.*total)(?=.*(?:odds|line|bet))", re.DOTALL)),
+)
+FILENAME_SOURCE_PATTERNS = (
+    ('sos', re.compile(r"^(?=.*strength of schedule)(?=.*fantasy)", re.DOTALL)),
+    ('projections', re.compile(r"projection|fantasy|footballers")),
+    ('draftkings', re.compile(r"draftkings|dk|salaries")),
+    ('nfl_odds', re.compile(r"odds|lines|betting")),
+)
+SOS_POSITION_PATTERN = re.compile(r"_(QB|RB|WR|TE|DST)(?=_)|SOS_D/ST_|D%2FST", re.IGNORECASE)
+SOS_POSITION_ORDER = ('QB', 'RB', 'WR', 'TE', 'DST')  # Priority when several positions match
 
 class DownloadsManager:
     """
@@ -36,16 +65,11 @@ class DownloadsManager:
     """
 
     def __init__(self):
-        self.project_dir = Path(__file__).parent.parent  # Go up one level from utils/
-        self.downloads_dir = self.project_dir / "downloads"
+        self.project_dir = PROJECT_DIR
+        self.downloads_dir = DOWNLOADS_DIR
         self.system_downloads = Path.home() / "Downloads"
 
-        self.sources = {
-            'projections': self.downloads_dir / "projections",
-            'draftkings': self.downloads_dir / "draftkings",
-            'nfl_odds': self.downloads_dir / "nfl_odds",
-            'sos': self.downloads_dir / "sos"
-        }
+        self.sources = dict(SOURCE_DIRS)
 
         self._setup_directories()
 
@@ -73,15 +97,22 @@ class DownloadsManager:
         cutoff_time = time.time() - (max_age_minutes * 60)
 
         try:
-            for file in self.system_downloads.glob("*.csv"):
-                if file.stat().st_mtime > cutoff_time:
-                    recent_files.append({
-                        'path': file,
-                        'name': file.name,
-                        'size': file.stat().st_size,
-                        'modified': file.stat().st_mtime,
-                        'source': self._identify_source(file.name, file)
-                    })
+            with os.scandir(self.system_downloads) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.csv'):
+                        continue
+
+                    # One stat per entry (cached on the DirEntry) serves the filter and the record
+                    file_stat = entry.stat()
+                    if file_stat.st_mtime > cutoff_time:
+                        file = Path(entry.path)
+                        recent_files.append({
+                            'path': file,
+                            'name': entry.name,
+                            'size': file_stat.st_size,
+                            'modified': file_stat.st_mtime,
+                            'source': self._identify_source(entry.name, file)
+                        })
         except Exception as e:
             print(f"⚠️  Error scanning downloads: {e}")
 
@@ -98,31 +129,22 @@ class DownloadsManager:
             str or None: Source identifier if found, None if no patterns match
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read(CONTENT_SAMPLE_SIZE).lower()  # First N chars
-
-            # SOS patterns (check first since it contains 'fantasy')
-            if 'strength of schedule' in content or ('opp avg' in content and 'fpa' in content):
-                return 'sos'
-            
-            # Projections patterns
-            if any(pattern in content for pattern in ['projpts', 'projown', 'fantasy', 'footballers']):
-                return 'projections'
-
-            # DraftKings patterns
-            if any(pattern in content for pattern in ['draftkings', 'salary', 'roster position']):
-                return 'draftkings'
+            # Binary read skips text-decoder setup; a multibyte char cut at the boundary is dropped
+            with open(filepath, 'rb') as f:
+                content = f.read(CONTENT_SAMPLE_SIZE).decode('utf-8', 'ignore').lower()
 
-            # NFL odds patterns
-            if any(pattern in content for pattern in ['spread', 'moneyline']) or ('total' in content and any(p in content for p in ['odds', 'line', 'bet'])):
-                return 'nfl_odds'
+            for source, pattern in CONTENT_SOURCE_PATTERNS:
+                if pattern.search(content):
+                    return source
 
         except Exception:
             pass
 
         return None
 
-    def _check_filename_patterns(self, filename):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _check_filename_patterns(filename):
         """
         Check filename for data source identification patterns.
 
@@ -134,14 +156,9 @@ class DownloadsManager:
         """
         filename_lower = filename.lower()
 
-        if 'strength of schedule' in filename_lower and 'fantasy' in filename_lower:
-            return 'sos'
-        elif any(pattern in filename_lower for pattern in ['projection', 'fantasy', 'footballers']):
-            return 'projections'
-        elif any(pattern in filename_lower for pattern in ['draftkings', 'dk', 'salaries']):
-            return 'draftkings'
-        elif any(pattern in filename_lower for pattern in ['odds', 'lines', 'betting']):
-            return 'nfl_odds'
+        for source, pattern in FILENAME_SOURCE_PATTERNS:
+            if pattern.search(filename_lower):
+                return source
 
         return 'unknown'
 
@@ -166,7 +183,9 @@ class DownloadsManager:
         # Fallback to filename patterns
         return self._check_filename_patterns(filename)
 
-    def _extract_sos_position(self, filename):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_sos_position(filename):
         """
         Extract position from SOS filename.
         
@@ -176,21 +195,14 @@ class DownloadsManager:
         Returns:
             str or None: Position (QB, RB, WR, TE, DST) if found, None otherwise
         """
-        filename_upper = filename.upper()
-        
-        # Check for position patterns in filename
-        if 'SOS_QB_' in filename_upper or '_QB_' in filename_upper:
-            return 'QB'
-        elif 'SOS_RB_' in filename_upper or '_RB_' in filename_upper:
-            return 'RB'
-        elif 'SOS_WR_' in filename_upper or '_WR_' in filename_upper:
-            return 'WR'
-        elif 'SOS_TE_' in filename_upper or '_TE_' in filename_upper:
-            return 'TE'
-        elif 'SOS_D/ST_' in filename_upper or '_DST_' in filename_upper or 'D%2FST' in filename_upper:
-            return 'DST'
-        
-        return None
+        found = {
+            match.group(1).upper() if match.group(1) else 'DST'
+            for match in SOS_POSITION_PATTERN.finditer(filename)
+        }
+        if not found:
+            return None
+
+        return next(position for position in SOS_POSITION_ORDER if position in found)
 
     def move_and_organize_files(self, files_to_move):
         """
@@ -239,16 +251,18 @@ class DownloadsManager:
             latest_path = dest_dir / f"{base_name}_latest.csv"
 
             try:
-                # Move the file
-                shutil.copy2(original_path, dest_path)
-
-                # Update latest file
-                if latest_path.exists():
-                    latest_path.unlink()
-                shutil.copy2(dest_path, latest_path)
-
-                # Remove from system downloads
-                original_path.unlink()
+                # Move the file (a rename on the same filesystem, copy + delete otherwise)
+                shutil.move(original_path, dest_path)
+
+                # Update latest file: hard-link (or copy if links are unsupported) to a temp
+                # name, then swap it in atomically so readers never see it missing
+                latest_tmp = latest_path.with_name(latest_path.name + ".tmp")
+                latest_tmp.unlink(missing_ok=True)
+                try:
+                    os.link(dest_path, latest_tmp)
+                except OSError:
+                    shutil.copy2(dest_path, latest_tmp)
+                os.replace(latest_tmp, latest_path)
 
                 moved_files.append({
                     'source': source,
@@ -296,7 +310,7 @@ class DownloadsManager:
 
         manifest_path = self.downloads_dir / "upload_manifest.json"
         with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+            json.dump(manifest, f, separators=(',', ':'))
 
         return manifest_path
 
@@ -310,32 +324,53 @@ class DownloadsManager:
         print("\n📁 Current DFS Data Files:")
         print("=" * 35)
 
+        # One listing of downloads/ answers every source and manifest existence check
+        try:
+            with os.scandir(self.downloads_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+
         total_files = 0
         for source, source_dir in self.sources.items():
-            files = list(source_dir.glob("*.csv"))
-            latest_files = list(source_dir.glob(f"{source.replace('_', '-')}*_latest.csv"))
+            latest_prefix = source.replace('_', '-')
+            file_count = 0
+            latest_file = None
+
+            # One scandir pass counts CSVs and finds the latest copy without building lists
+            if source_dir.name in present:
+                try:
+                    with os.scandir(source_dir) as entries:
+                        for entry in entries:
+                            if not entry.name.endswith('.csv'):
+                                continue
+                            file_count += 1
+                            if (latest_file is None and entry.name.startswith(latest_prefix)
+                                    and entry.name.endswith('_latest.csv')):
+                                latest_file = entry
+                except (FileNotFoundError, NotADirectoryError):
+                    pass
 
             print(f"\n🏈 {source.replace('_', ' ').title()}:")
 
-            if latest_files:
-                latest_file = latest_files[0]
-                mod_time = datetime.fromtimestamp(latest_file.stat().st_mtime)
-                size_mb = latest_file.stat().st_size / (1024 * 1024)
+            if latest_file:
+                latest_stat = latest_file.stat()
+                mod_time = datetime.fromtimestamp(latest_stat.st_mtime)
+                size_mb = latest_stat.st_size / (1024 * 1024)
                 print(f"   📄 Latest: {latest_file.name}")
                 print(f"   📅 Updated: {mod_time.strftime('%Y-%m-%d %H:%M')}")
                 print(f"   📊 Size: {size_mb:.1f} MB")
             else:
                 print("   ❌ No data available")
 
-            print(f"   📁 Total files: {len(files)}")
-            total_files += len(files)
+            print(f"   📁 Total files: {file_count}")
+            total_files += file_count
 
         print(f"\n🎯 Total CSV files: {total_files}")
 
         # Check for upload manifest
-        manifest_path = self.downloads_dir / "upload_manifest.json"
-        if manifest_path.exists():
-            print(f"📋 Upload manifest: Ready ({manifest_path.name})")
+        if "upload_manifest.json" in present:
+            print("📋 Upload manifest: Ready (upload_manifest.json)")
         else:
             print("📋 Upload manifest: Not created")
 
@@ -6,41 +6,222 @@ Shared functions used across multiple scrapers to reduce code duplication
 and maintain consistency.
 """
 
+import functools
+import os
 import subprocess
+import threading
 import time
-from datetime import datetime, timedelta
+import webbrowser
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+try:
+    # Optional: wake on filesystem events instead of waiting out each poll interval
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+try:
+    # Optional (PyObjC, macOS): post Cmd+W to Arc in-process instead of spawning osascript
+    import Quartz
+    from AppKit import NSRunningApplication
+except ImportError:
+    Quartz = None
 
 # Configuration constants
 DOWNLOAD_RECENT_WINDOW = 120  # Seconds window for recent file detection
 BROWSER_WAIT_TIME = 5  # Seconds to wait for page load
-FILE_CHECK_TIMEOUT = 3  # Seconds to wait for file download
+DOWNLOAD_WAIT_TIMEOUT = 15  # Max seconds to poll for a download after a manual step
+DOWNLOAD_POLL_INTERVAL = 0.5  # Seconds between Downloads folder polls
+SIGNATURE_SAMPLE_SIZE = 200  # Bytes read when checking a download's header
 DEFAULT_TIMEOUT = 30  # Default timeout for API requests
+DOWNLOADS_DIR = Path.home() / "Downloads"  # Resolved once; scanned on every download check
+NFL_ODDS_CSV_PREFIX = "NFL_Odds_"  # Odds CSVs are written by the HTTP scraper, not the browser
+SCRAPER_WRITTEN_PREFIXES = (NFL_ODDS_CSV_PREFIX,)  # Never a browser download, so watchers skip them
+ARC_BUNDLE_ID = "company.thebrowser.Browser"  # Arc's macOS bundle identifier
+W_KEY_CODE = 13  # macOS virtual key code for "W"
+ARC_TAB_OPEN_TIMEOUT = 3  # Max seconds to wait for Arc to show a newly opened tab
+ARC_TAB_CHECK_INTERVAL = 0.2  # Seconds between checks of Arc's active tab
+FALLBACK_TAB_OPEN_DELAY = 2  # Seconds to let the default browser open a page it can't confirm
 
 # NFL Season constants - update each year
 NFL_SEASON_START_DATE = datetime(2025, 9, 5)  # First Thursday night game of Week 1
 NFL_WEEKS_IN_SEASON = 18
 
 
+def _week1_monday(season_start: datetime) -> date:
+    """Return the Monday that starts Week 1 prep for a season kicking off on season_start."""
+    # Week 1 games are around Sept 7-8 (first Sunday), so Week 1 prep starts Sept 2 (Monday)
+    # Week 2 games are around Sept 14-15, so Week 2 prep starts Sept 9 (Monday)
+    # Week 3 games are around Sept 21-22, so Week 3 prep starts Sept 16 (Monday)
+    first_sunday = season_start + timedelta(days=(6 - season_start.weekday()) % 7)
+    if first_sunday == season_start:  # If season starts on Sunday
+        first_sunday = season_start + timedelta(days=7)
+
+    return (first_sunday - timedelta(days=6)).date()  # Monday before first Sunday
+
+
+WEEK1_MONDAY = _week1_monday(NFL_SEASON_START_DATE)  # Derived once from the constant above
+
+
 def check_downloads() -> List[Path]:
     """
     Check for new CSV files in Downloads folder.
 
     Scans the ~/Downloads directory for CSV files modified in the last 2 minutes.
+    CSVs saved directly by the HTTP scrapers are skipped, since they may land
+    while a browser-driven scraper is waiting for its own download.
 
     Returns:
         list: List of Path objects for recent CSV files, sorted by modification time (newest first)
     """
-    downloads_dir = Path.home() / "Downloads"
     recent_csvs = []
     now = time.time()
 
-    for file in downloads_dir.glob("*.csv"):
-        if now - file.stat().st_mtime < DOWNLOAD_RECENT_WINDOW:
-            recent_csvs.append(file)
+    try:
+        # DirEntry caches its stat result, so each file is stat'ed at most once
+        with os.scandir(DOWNLOADS_DIR) as entries:
+            for entry in entries:
+                if (not entry.name.endswith('.csv') or entry.name.startswith(SCRAPER_WRITTEN_PREFIXES)
+                        or not entry.is_file()):
+                    continue
+                mtime = entry.stat().st_mtime
+                if now - mtime < DOWNLOAD_RECENT_WINDOW:
+                    recent_csvs.append((mtime, entry.path))
+    except FileNotFoundError:
+        return []
+
+    recent_csvs.sort(reverse=True)
+    return [Path(path) for _, path in recent_csvs]
+
+
+def _has_signature(file_path: Path, signature: str) -> bool:
+    """Check whether the start of a file contains the given signature."""
+    try:
+        with open(file_path, 'rb') as f:
+            return signature.encode('utf-8') in f.read(SIGNATURE_SAMPLE_SIZE)
+    except OSError:
+        return False
+
+
+def _start_downloads_watcher(wake_event: threading.Event):
+    """
+    Start a watchdog observer that sets wake_event whenever a CSV lands in ~/Downloads.
+
+    Args:
+        wake_event: Event to set on CSV create, modify, or rename events
+
+    Returns:
+        Observer or None: Running observer, or None if watchdog is unavailable
+    """
+    if Observer is None:
+        return None
+
+    class _CsvEventHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Browsers often write a temp file and rename it, so check the destination too
+            paths = (event.src_path, getattr(event, 'dest_path', ''))
+            if any(str(path).endswith('.csv') for path in paths):
+                wake_event.set()
+
+    try:
+        observer = Observer()
+        observer.schedule(_CsvEventHandler(), str(DOWNLOADS_DIR), recursive=False)
+        observer.start()
+        return observer
+    except (OSError, RuntimeError):
+        return None
+
+
+def wait_for_new_download(initial_files: Iterable[Path], timeout: float = DOWNLOAD_WAIT_TIMEOUT,
+                          signature: Optional[str] = None) -> List[Path]:
+    """
+    Poll the Downloads folder until a new CSV appears or the timeout expires.
+
+    When watchdog is installed, filesystem events wake the wait immediately;
+    the folder is still polled every DOWNLOAD_POLL_INTERVAL in case an event
+    is missed.
+
+    Args:
+        initial_files: CSV files present before the download was started
+        timeout: Maximum number of seconds to wait
+        signature: Optional text expected near the start of the new file
+
+    Returns:
+        list: New CSV files (newest first) matching the signature if one is given,
+              empty if nothing suitable appeared in time
+    """
+    known_files = set(initial_files)
+    deadline = time.monotonic() + timeout
+    wake_event = threading.Event()
+    observer = _start_downloads_watcher(wake_event)
+
+    try:
+        while True:
+            new_files = [f for f in check_downloads() if f not in known_files]
+            if signature is not None:
+                new_files = [f for f in new_files if _has_signature(f, signature)]
+            if new_files:
+                return new_files
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+
+            wake_event.wait(min(DOWNLOAD_POLL_INTERVAL, remaining))
+            wake_event.clear()
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+
+class DomainRateLimiter:
+    """
+    Enforce a minimum delay between requests to the same host.
+
+    Unlike a fixed sleep between steps, acquire() only waits for whatever part
+    of the host's delay has not already elapsed, and hosts are throttled
+    independently of each other.
+    """
+
+    def __init__(self, min_delays: Dict[str, float], default_delay: float = 0.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            min_delays: Mapping of hostname to minimum seconds between requests
+            default_delay: Delay for hosts not listed in min_delays
+        """
+        self.min_delays = min_delays
+        self.default_delay = default_delay
+        self._last_hit = {}
+        self._lock = threading.Lock()
 
-    return sorted(recent_csvs, key=lambda x: x.stat().st_mtime, reverse=True)
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to the URL's host is allowed, then record it.
+
+        Args:
+            url: URL about to be requested or opened
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        host = urlparse(url).netloc
+        delay = self.min_delays.get(host, self.default_delay)
+
+        with self._lock:
+            last_hit = self._last_hit.get(host)
+            wait = 0.0 if last_hit is None else max(0.0, last_hit + delay - time.monotonic())
+            if wait:
+                time.sleep(wait)
+            self._last_hit[host] = time.monotonic()
+
+        return wait
 
 
 def get_current_nfl_week() -> int:
@@ -58,30 +239,18 @@ def get_current_nfl_week() -> int:
     Returns:
         int: Current NFL week (1-18), defaults to 1 if before season or 18 if after
     """
-    now = datetime.now()
+    return _compute_nfl_week(datetime.now().date())
+
 
+@functools.lru_cache(maxsize=32)
+def _compute_nfl_week(today: date) -> int:
+    """Compute the NFL week for a calendar date; the result only changes at midnight."""
     # If we're before the season starts, default to week 1
-    if now < NFL_SEASON_START_DATE:
+    if today < NFL_SEASON_START_DATE.date():
         return 1
 
-    # For DFS purposes, each Monday starts the prep for upcoming Sunday games
-    # Week 1 games are around Sept 7-8 (first Sunday), so Week 1 prep starts Sept 2 (Monday)
-    # Week 2 games are around Sept 14-15, so Week 2 prep starts Sept 9 (Monday)
-    # Week 3 games are around Sept 21-22, so Week 3 prep starts Sept 16 (Monday)
-
-    # Find the first Monday of the season (Monday before first games)
-    # If first game is around Sept 7-8, then first Monday is Sept 2
-    first_sunday = NFL_SEASON_START_DATE + timedelta(days=(6 - NFL_SEASON_START_DATE.weekday()) % 7)
-    if first_sunday == NFL_SEASON_START_DATE:  # If season starts on Sunday
-        first_sunday = NFL_SEASON_START_DATE + timedelta(days=7)
-
-    week1_monday = first_sunday - timedelta(days=6)  # Monday before first Sunday
-
-    # Calculate days since Week 1 Monday
-    days_since_week1_monday = (now - week1_monday).days
-
-    # Each week starts on Monday, so divide by 7 and add 1
-    current_week = (days_since_week1_monday // 7) + 1
+    # Each week starts on Monday, so divide days since Week 1 Monday by 7 and add 1
+    current_week = ((today - WEEK1_MONDAY).days // 7) + 1
 
     # Cap at max weeks in season
     if current_week > NFL_WEEKS_IN_SEASON:
@@ -90,19 +259,143 @@ def get_current_nfl_week() -> int:
     return current_week
 
 
-def close_arc_tab(context_name: str = "tab") -> bool:
+def open_arc_url(url: str) -> bool:
+    """
+    Open a URL in a new Arc browser tab using AppleScript.
+
+    Opening through Arc directly keeps the tab in the same browser that
+    close_arc_tab() later closes. `open location` returns before the tab
+    exists, so the script then waits (up to ARC_TAB_OPEN_TIMEOUT) for Arc's
+    active tab to be on the page's host. Falls back to the default browser,
+    with a short fixed wait, when AppleScript is unavailable.
+
+    Args:
+        url: Page to open
+
+    Returns:
+        bool: True if Arc reported the new tab as active, False otherwise
+    """
+    try:
+        # The URL is passed as an argument rather than interpolated into the script
+        open_script = '''
+        on run argv
+            set targetHost to item 2 of argv
+            tell application "Arc"
+                open location (item 1 of argv)
+                repeat (item 3 of argv) as integer times
+                    try
+                        if (URL of active tab of front window) contains targetHost then return "opened"
+                    end try
+                    delay ((item 4 of argv) as integer) / 1000
+                end repeat
+            end tell
+            return "timeout"
+        end run
+        '''
+        checks = int(ARC_TAB_OPEN_TIMEOUT / ARC_TAB_CHECK_INTERVAL)
+        result = subprocess.run(['osascript', '-e', open_script, url, urlparse(url).netloc,
+                                 str(checks), str(int(ARC_TAB_CHECK_INTERVAL * 1000))],
+                                capture_output=True, text=True, timeout=ARC_TAB_OPEN_TIMEOUT + 5)
+        if result.returncode == 0:
+            return result.stdout.strip() == "opened"
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+    webbrowser.open(url)
+    time.sleep(FALLBACK_TAB_OPEN_DELAY)  # Nothing to confirm the tab against, so give it a moment
+    return False
+
+
+def _post_arc_close_shortcut() -> bool:
+    """
+    Send Cmd+W straight to Arc's process with Quartz keyboard events.
+
+    macOS silently drops posted events without the Accessibility permission,
+    so nothing is sent unless CGPreflightPostEventAccess() says they'll arrive.
+
+    Returns:
+        bool: True if the events were posted, False if PyObjC is missing, posting
+              isn't permitted or Arc isn't running
+    """
+    if Quartz is None:
+        return False
+
+    # Only on macOS 10.15+; older systems can't tell ahead of time, so don't rely on it there
+    preflight = getattr(Quartz, 'CGPreflightPostEventAccess', None)
+    if preflight is None or not preflight():
+        return False
+
+    apps = NSRunningApplication.runningApplicationsWithBundleIdentifier_(ARC_BUNDLE_ID)
+    if not apps:
+        return False
+
+    pid = apps[0].processIdentifier()
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(None, W_KEY_CODE, key_down)
+        if event is None:
+            return False
+        Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+        Quartz.CGEventPostToPid(pid, event)
+
+    return True
+
+
+def _arc_active_tab_matches(url: str) -> bool:
+    """
+    Check that Arc's active tab is on the same host as url.
+
+    Returns:
+        bool: True if it is, False if it isn't or Arc couldn't be asked
+    """
+    check_script = '''
+    on run argv
+        tell application "Arc" to return (URL of active tab of front window) contains (item 1 of argv)
+    end run
+    '''
+    try:
+        result = subprocess.run(['osascript', '-e', check_script, urlparse(url).netloc],
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+def close_arc_tab(context_name: str = "tab", expected_url: Optional[str] = None) -> bool:
     """
     Close the current Arc browser tab using AppleScript.
 
+    Tries Arc's own scripting command first, which needs no window focus,
+    delay or Accessibility permission. If that fails, posts Cmd+W to Arc
+    in-process when PyObjC is installed and event posting is permitted,
+    and finally falls back to sending Cmd+W through System Events.
+
     Args:
         context_name: Description for the tab being closed (for logging)
+        expected_url: Page the tab should be showing; when given, the tab is
+            only closed if Arc's active tab is on that page's host
 
     Returns:
         bool: True if tab was closed successfully, False otherwise
     """
     print(f"🔄 Closing {context_name}...")
 
+    if expected_url is not None and not _arc_active_tab_matches(expected_url):
+        # Cmd+W would hit whatever tab is active, which may be the user's own
+        print(f"⚠️ Active Arc tab isn't on {urlparse(expected_url).netloc}, leaving {context_name} open")
+        return False
+
     try:
+        direct_script = 'tell application "Arc" to close active tab of front window'
+        result = subprocess.run(['osascript', '-e', direct_script],
+                                capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            print(f"✅ {context_name.title()} closed")
+            return True
+
+        if _post_arc_close_shortcut():
+            print(f"✅ {context_name.title()} closed")
+            return True
+
         close_script = '''
         tell application "Arc"
             activate
@@ -153,7 +446,6 @@ def simple_manual_approach(instructions: List[str], context: str = "") -> bool:
         print("   ⏳ Checking for download...")
         return True
     except EOFError:
-        # Non-interactive mode, just wait briefly
+        # Non-interactive mode; callers wait on the Downloads watcher, so no fixed sleep here
         print("Running in non-interactive mode...")
-        time.sleep(2)
         return False  # In auto-skip since user can't interact
\ No newline at end of file
@@ -6,9 +6,39 @@ This module provides common functionality for executing scrapers with proper
 error handling, timeout management, and consistent logging.
 """
 
+import collections
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Scrapers report from worker threads; print writes text and newline separately
+_print_lock = threading.Lock()
+
+SCRAPER_TIMEOUT = 300  # Seconds before a scraper run is killed
+STDERR_TAIL_LINES = 200  # Lines of scraper stderr kept for failure reports
+SCRAPER_NOTICE_MARKER = "[notice] "  # Prefix of stderr lines shown even when a scraper succeeds
+
+# Flags understood by a single scraper only, keyed to that scraper's directory name
+SCRAPER_SPECIFIC_FLAGS = {
+    '--refresh-contest': 'draftkings',
+}
+
+
+def _log(message=""):
+    """Print one line without interleaving with output from other scraper threads."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def _read_stderr(stream, tail, notices):
+    """Keep the last lines of a scraper's stderr, collecting marked notices separately."""
+    for line in stream:
+        tail.append(line)
+        if line.startswith(SCRAPER_NOTICE_MARKER):
+            notices.append(line[len(SCRAPER_NOTICE_MARKER):].rstrip())
+
 
 def run_scraper(scraper_path, scraper_file, description, args=None):
     """
@@ -23,61 +53,155 @@ def run_scraper(scraper_path, scraper_file, description, args=None):
     Returns:
         bool: True if scraper completed successfully, False otherwise
     """
-    print(f"🔄 {description}...")
+    _log(f"🔄 {description}...")
     try:
         # Add auto-skip flag for interactive scrapers to prevent prompt blocking
-        cmd = ['python3', scraper_file]
+        cmd = [sys.executable, str(scraper_path / scraper_file)]
         if 'fantasy_footballers' in str(scraper_path) or 'tffb_sos' in str(scraper_path):
             cmd.append('--auto-skip')
         
-        # Add any additional arguments passed to the scraper
+        # Add any additional arguments passed to the scraper, dropping flags meant for others
         if args:
-            cmd.extend(args)
-
-        result = subprocess.run(
+            cmd.extend(
+                arg for arg in args
+                if SCRAPER_SPECIFIC_FLAGS.get(arg, scraper_path.name) == scraper_path.name
+            )
+
+        # Scrapers resolve their paths from __file__, so no cwd is needed. Leaving out
+        # cwd and keeping inherited fds lets subprocess take its posix_spawn fast path
+        # instead of forking this process (Python's own pipes are non-inheritable).
+        # stdout was never shown, so discard it; keep only the tail of stderr in memory
+        process = subprocess.Popen(
             cmd,
-            cwd=scraper_path,
-            capture_output=True,
-            text=True,
-            timeout=300
+            close_fds=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
         )
-
-        if result.returncode == 0:
-            print(f"✅ {description} completed successfully")
+        stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+        notices = []  # Kept apart so library noise can't push them out of the tail
+        reader = threading.Thread(target=_read_stderr, args=(process.stderr, stderr_tail, notices),
+                                  daemon=True)
+        reader.start()
+
+        try:
+            returncode = process.wait(timeout=SCRAPER_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            reader.join()
+            process.stderr.close()
+
+        if returncode == 0:
+            _log(f"✅ {description} completed successfully")
+            for notice in notices:
+                # e.g. the odds scraper falling back to a stale cached response
+                _log(f"   {notice}")
             return True
         else:
-            print(f"❌ {description} failed: {result.stderr}")
+            _log(f"❌ {description} failed: {''.join(stderr_tail)}")
             return False
     except subprocess.TimeoutExpired:
-        print(f"⏰ {description} timed out")
+        _log(f"⏰ {description} timed out")
         return False
     except Exception as e:
-        print(f"❌ {description} error: {e}")
+        _log(f"❌ {description} error: {e}")
         return False
 
 
-def run_scrapers(scrapers, args=None):
+def _run_scraper_config(scraper_path, scraper_file, description, args=None):
     """
-    Run multiple scrapers and collect results.
+    Run a single scraper config after checking that its script exists.
 
     Args:
-        scrapers (list): List of tuples (scraper_path, scraper_file, description)
-        args (list, optional): Additional arguments to pass to all scrapers
+        scraper_path (Path): Directory containing the scraper script
+        scraper_file (str): Name of the scraper script to run
+        description (str): Human-readable description for logging
+        args (list, optional): Additional arguments to pass to the scraper
 
     Returns:
-        list: List of (description, success) tuples
+        bool: True if scraper completed successfully, False otherwise
     """
-    results = []
+    if not (scraper_path.exists() and (scraper_path / scraper_file).exists()):
+        _log(f"⚠️  {description} scraper not found at {scraper_path}")
+        return False
+
+    return run_scraper(scraper_path, scraper_file, description, args)
 
-    for scraper_path, scraper_file, description in scrapers:
-        if scraper_path.exists() and (scraper_path / scraper_file).exists():
-            success = run_scraper(scraper_path, scraper_file, description, args)
-            results.append((description, success))
-        else:
-            print(f"⚠️  {description} scraper not found at {scraper_path}")
-            results.append((description, False))
 
-        print()  # Add spacing between scrapers
+def _run_serial_configs(indexed_configs, args=None):
+    """
+    Run browser-driven scrapers one after another, in config order.
+
+    They share the foreground browser and the Downloads folder they watch,
+    so a fixed order keeps each one's download window to itself.
+
+    Args:
+        indexed_configs (list): (index, scraper config) pairs to run in order
+        args (list, optional): Additional arguments to pass to the scrapers
+
+    Returns:
+        list: (index, success) pairs in the order run
+    """
+    outcomes = []
+    for index, (scraper_path, scraper_file, description, _) in indexed_configs:
+        try:
+            success = _run_scraper_config(scraper_path, scraper_file, description, args)
+        except Exception as e:
+            _log(f"❌ {description} error: {e}")
+            success = False
+        outcomes.append((index, success))
+        _log()  # Add spacing between scrapers
+    return outcomes
+
+
+def run_scrapers(scrapers, args=None):
+    """
+    Run multiple scrapers concurrently and collect results.
+
+    Pure-HTTP scrapers each run in parallel with the browser-driven ones,
+    which are executed in config order by a single worker since they share
+    the foreground browser.
+
+    Args:
+        scrapers (list): List of tuples (scraper_path, scraper_file, description, concurrent)
+        args (list, optional): Additional arguments to pass to all scrapers
+
+    Returns:
+        list: List of (description, success) tuples, in the order given
+    """
+    if not scrapers:
+        return []
+
+    results = [None] * len(scrapers)
+    serial_configs = [(index, config) for index, config in enumerate(scrapers) if not config[3]]
+    concurrent_configs = [(index, config) for index, config in enumerate(scrapers) if config[3]]
+
+    with ThreadPoolExecutor(max_workers=len(concurrent_configs) + 1) as executor:
+        futures = {
+            executor.submit(_run_scraper_config, *config[:3], args): index
+            for index, config in concurrent_configs
+        }
+        serial_future = executor.submit(_run_serial_configs, serial_configs, args) if serial_configs else None
+
+        for future in as_completed(futures):
+            index = futures[future]
+            description = scrapers[index][2]
+            try:
+                success = future.result()
+            except Exception as e:
+                _log(f"❌ {description} error: {e}")
+                success = False
+            results[index] = (description, success)
+
+            _log()  # Add spacing between scrapers
+
+        # _run_serial_configs catches per-scraper errors itself
+        if serial_future is not None:
+            for index, success in serial_future.result():
+                results[index] = (scrapers[index][2], success)
 
     return results
 
@@ -93,17 +217,16 @@ def print_results_summary(results, title="Collection Summary"):
     Returns:
         tuple: (successful_count, total_count)
     """
-    print(f"📊 {title}:")
-    print("-" * len(title))
-
     successful = sum(1 for _, success in results if success)
     total = len(results)
 
+    # Build the block first so it goes out in one write
+    summary_lines = [f"📊 {title}:", "-" * len(title)]
     for description, success in results:
         status = "✅" if success else "❌"
-        print(f"{status} {description}")
+        summary_lines.append(f"{status} {description}")
+    summary_lines.append(f"\n🎯 Completed: {successful}/{total} scrapers successful\n")
 
-    print(f"\n🎯 Completed: {successful}/{total} scrapers successful")
-    print()
+    print("\n".join(summary_lines), flush=True)
 
     return successful, total
\ No newline at end of file
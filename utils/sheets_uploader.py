@@ -12,11 +12,140 @@ Usage:
     uploader.upload_all_dfs_data()
 """
 
+import hashlib
+import os
+import random
+import time
+import numpy as np
 import pandas as pd
 import gspread
 from google.auth.exceptions import DefaultCredentialsError
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+DOWNLOADS_DIR = Path(__file__).resolve().parent.parent / "downloads"  # Organized CSVs to upload
+UPLOAD_MARKER_SUFFIX = ".uploaded_sha"  # Sidecar next to each CSV recording what was last uploaded
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024  # Read size when hashing CSVs without hashlib.file_digest
+API_MAX_RETRIES = 3  # Retries for rate-limited or failing Sheets API calls
+API_RETRY_BASE_DELAY = 1.0  # Seconds before the first retry; doubles each attempt
+API_RETRY_MAX_DELAY = 30.0  # Cap on any single retry delay, including server Retry-After
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})  # Worth retrying; 4xx auth errors are not
+
+# Trims string cells and leaves every other value untouched, element-wise over an object array
+_strip_strings = np.frompyfunc(lambda value: value.strip() if isinstance(value, str) else value, 1, 1)
+
+# Offline upload preview: {'tabs': {tab_name: data_rows}, 'skipped': [tab_name, ...],
+#                          'estimated_cells': int, 'estimated_api_calls': int}
+UploadPlan = Dict[str, Union[Dict[str, int], List[str], int]]
+
+# Authorized clients and opened spreadsheets, reused by every uploader in this process
+_CLIENT_CACHE: Dict[Tuple[str, str], Tuple[gspread.Client, gspread.Spreadsheet]] = {}
+
+
+def _with_backoff(api_call, *args, **kwargs):
+    """
+    Run a Sheets API call, retrying rate-limit and server errors with exponential backoff.
+
+    Honors the server's Retry-After header when present and adds jitter
+    otherwise so retries from several runs don't land together.
+
+    Args:
+        api_call: gspread method to call
+        *args, **kwargs: Arguments passed through to api_call
+
+    Returns:
+        Whatever api_call returns
+
+    Raises:
+        gspread.exceptions.APIError: If the error isn't retryable or retries run out
+    """
+    for attempt in range(API_MAX_RETRIES + 1):
+        try:
+            return api_call(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = e.response.status_code
+            if status not in RETRYABLE_STATUS_CODES or attempt == API_MAX_RETRIES:
+                raise
+
+            try:
+                delay = float(e.response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                delay = API_RETRY_BASE_DELAY * 2 ** attempt * (1 + random.random() * 0.5)
+            delay = min(delay, API_RETRY_MAX_DELAY)
+
+            print(f"⏳ Sheets API returned {status}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+def _cell_data(value) -> dict:
+    """Convert a CSV value into Sheets CellData, matching RAW value input."""
+    if value == '':
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+
+def _replace_tab_requests(worksheet: gspread.Worksheet, data: List[List]) -> List[dict]:
+    """
+    Build batchUpdate requests that clear a tab's values and write new ones.
+
+    The values go as CellData, which is a few times larger on the wire than
+    the plain arrays values.update takes; that is the price of clearing and
+    writing in one request. Every request sets absolute state, so the batch
+    is safe for _with_backoff to replay after a server error.
+
+    Args:
+        worksheet: Target worksheet (its grid size decides whether to grow it)
+        data: Rows to write, starting at A1
+
+    Returns:
+        List of Sheets API request objects
+    """
+    requests = []
+    rows, cols = _grown_grid_size(worksheet, data)
+
+    # updateCells cannot write past the grid, unlike values.update. An absolute
+    # size (rather than appendDimension) can't grow the grid twice if replayed;
+    # only the dimensions that must grow are set, so nothing is ever shrunk.
+    grid_properties = {}
+    if rows > worksheet.row_count:
+        grid_properties['rowCount'] = rows
+    if cols > worksheet.col_count:
+        grid_properties['columnCount'] = cols
+    if grid_properties:
+        requests.append({'updateSheetProperties': {
+            'properties': {'sheetId': worksheet.id, 'gridProperties': grid_properties},
+            'fields': ','.join(f"gridProperties.{name}" for name in grid_properties)
+        }})
+
+    # Clear values only (formatting stays, as with worksheet.clear()), then write from A1
+    requests.append({'updateCells': {'range': {'sheetId': worksheet.id}, 'fields': 'userEnteredValue'}})
+    requests.append({'updateCells': {
+        'start': {'sheetId': worksheet.id, 'rowIndex': 0, 'columnIndex': 0},
+        'rows': [{'values': [_cell_data(value) for value in row]} for row in data],
+        'fields': 'userEnteredValue'
+    }})
+    return requests
+
+
+def _grown_grid_size(worksheet: gspread.Worksheet, data: List[List]) -> Tuple[int, int]:
+    """Return the (rows, cols) grid needed to hold data, never smaller than the current one."""
+    width = max(len(row) for row in data)
+    return max(worksheet.row_count, len(data)), max(worksheet.col_count, width)
+
+
+def _record_grid_size(worksheet: gspread.Worksheet, data: List[List]):
+    """
+    Update a cached worksheet handle's grid size after _replace_tab_requests succeeded.
+
+    gspread only refreshes row_count/col_count in its own resize(), so handles
+    reused across uploads would otherwise keep the pre-upload size.
+    """
+    rows, cols = _grown_grid_size(worksheet, data)
+    worksheet._properties['gridProperties'].update(rowCount=rows, columnCount=cols)
 
 
 class SheetsUploader:
@@ -33,7 +162,8 @@ class SheetsUploader:
         'nfl_odds': 'Odds'
     }
 
-    def __init__(self, credentials_path: str, sheet_id: str, tab_mappings: Dict[str, str] = None):
+    def __init__(self, credentials_path: str, sheet_id: str, tab_mappings: Dict[str, str] = None,
+                 connect: bool = True):
         """
         Initialize the Google Sheets uploader.
 
@@ -41,32 +171,39 @@ class SheetsUploader:
             credentials_path: Path to Google service account JSON file
             sheet_id: Google Sheets ID (from the sheet URL)
             tab_mappings: Optional custom tab mappings (defaults to DEFAULT_TAB_MAPPINGS)
+            connect: Authenticate right away; pass False to only plan uploads offline
         """
         self.credentials_path = Path(credentials_path)
         self.sheet_id = sheet_id
         self.tab_mappings = tab_mappings or self.DEFAULT_TAB_MAPPINGS
         self.client = None
         self.sheet = None
+        self._worksheets: Dict[str, gspread.Worksheet] = {}  # Tab name -> handle, filled lazily
 
-        self._authenticate()
+        if connect:
+            self._authenticate()
 
     def _authenticate(self):
         """
         Authenticate with Google Sheets using service account credentials.
         """
         try:
-            if not self.credentials_path.exists():
-                raise FileNotFoundError(
-                    f"Credentials file not found: {self.credentials_path}\n"
-                    "Please ensure you have downloaded your Google service account JSON file."
-                )
+            # Reuse the token exchange and spreadsheet lookup from an earlier uploader
+            cache_key = (str(self.credentials_path.resolve()), self.sheet_id)
+            if cache_key not in _CLIENT_CACHE:
+                client = gspread.service_account(filename=self.credentials_path)
+                _CLIENT_CACHE[cache_key] = (client, _with_backoff(client.open_by_key, self.sheet_id))
 
-            # Authenticate using service account
-            self.client = gspread.service_account(filename=self.credentials_path)
-            self.sheet = self.client.open_by_key(self.sheet_id)
+            self.client, self.sheet = _CLIENT_CACHE[cache_key]
 
             print(f"✅ Connected to Google Sheet: {self.sheet.title}")
 
+        except FileNotFoundError:
+            # Raised by the credentials read itself, so the file isn't stat'ed up front
+            raise FileNotFoundError(
+                f"Credentials file not found: {self.credentials_path}\n"
+                "Please ensure you have downloaded your Google service account JSON file."
+            ) from None
         except DefaultCredentialsError as e:
             raise Exception(f"Authentication failed: {e}")
         except gspread.exceptions.APIError as e:
@@ -74,56 +211,215 @@ class SheetsUploader:
         except Exception as e:
             raise Exception(f"Failed to connect to Google Sheets: {e}")
 
-    def upload_csv_to_tab(self, csv_path: Path, tab_name: str) -> bool:
+    def _read_csv_values(self, csv_path: Path, tab_name: str) -> Optional[List[List]]:
         """
-        Upload a CSV file to a specific Google Sheets tab.
+        Read and clean a CSV file into sheet values.
 
         Args:
             csv_path: Path to the CSV file
-            tab_name: Name of the sheet tab to update
+            tab_name: Name of the sheet tab (for logging)
 
         Returns:
-            bool: True if upload successful, False otherwise
+            List of rows including the header, or None if the file is missing or empty
         """
+        # Read CSV file; a missing file surfaces here instead of through a separate exists() check
         try:
-            if not csv_path.exists():
-                print(f"⏭️  Skipping {tab_name}: CSV file not found ({csv_path.name})")
-                return False
+            df = pd.read_csv(csv_path, memory_map=True)  # Parse from mapped page-cache pages
+        except FileNotFoundError:
+            print(f"⏭️  Skipping {tab_name}: CSV file not found ({csv_path.name})")
+            return None
 
-            # Read CSV file
-            df = pd.read_csv(csv_path)
+        if df.empty:
+            print(f"⏭️  Skipping {tab_name}: CSV file is empty")
+            return None
 
-            if df.empty:
-                print(f"⏭️  Skipping {tab_name}: CSV file is empty")
-                return False
+        # Blank out NaN and infinite values, then trim whitespace, in one object array
+        values = df.to_numpy(dtype=object)
+        values[pd.isna(values) | (values == float('inf')) | (values == float('-inf'))] = ''
+        rows = _strip_strings(values).tolist()
 
-            # Handle NaN and infinite values
-            df = df.fillna('')  # Replace NaN with empty strings
-            df = df.replace([float('inf'), float('-inf')], '')  # Replace inf with empty strings
-            df = df.apply(lambda col: col.str.strip() if col.dtype == "object" else col) # Trim Whitespace
+        # Drop trailing all-blank rows (e.g. ",,," lines) so they aren't sent to the sheet
+        while rows and all(value == '' for value in rows[-1]):
+            rows.pop()
 
+        # Convert to list of lists (including headers)
+        return [df.columns.tolist()] + rows
+
+    def _get_or_create_worksheet(self, tab_name: str) -> gspread.Worksheet:
+        """
+        Return the worksheet for a tab, creating it if needed and caching the handle.
+
+        Args:
+            tab_name: Name of the sheet tab
+
+        Returns:
+            gspread.Worksheet for the tab
+        """
+        if tab_name not in self._worksheets:
             try:
-                worksheet = self.sheet.worksheet(tab_name)
+                worksheet = _with_backoff(self.sheet.worksheet, tab_name)
             except gspread.WorksheetNotFound:
                 print(f"📋 Creating new tab: {tab_name}")
-                worksheet = self.sheet.add_worksheet(title=tab_name, rows=1000, cols=26)
+                worksheet = _with_backoff(self.sheet.add_worksheet, title=tab_name, rows=1000, cols=26)
+            self._worksheets[tab_name] = worksheet
+
+        return self._worksheets[tab_name]
+
+    def _upload_fingerprint(self, csv_path: Path, tab_name: str) -> Optional[str]:
+        """
+        Identify a CSV's content together with the sheet and tab it is uploaded to.
+
+        Args:
+            csv_path: Path to the CSV file
+            tab_name: Name of the sheet tab
+
+        Returns:
+            Fingerprint string, or None if the file can't be read
+        """
+        try:
+            with open(csv_path, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):
+                    digest = hashlib.file_digest(f, 'sha256').hexdigest()
+                else:
+                    # hashlib.file_digest is Python 3.11+
+                    hasher = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(FINGERPRINT_CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+                    digest = hasher.hexdigest()
+        except OSError:
+            return None
+
+        return f"{self.sheet_id}/{tab_name}/{digest}"
+
+    def _is_unchanged(self, csv_path: Path, fingerprint: Optional[str]) -> bool:
+        """Check whether the CSV was already uploaded with this exact fingerprint."""
+        if fingerprint is None:
+            return False
+
+        try:
+            marker = csv_path.with_name(csv_path.name + UPLOAD_MARKER_SUFFIX)
+            return marker.read_text() == fingerprint
+        except OSError:
+            return False
 
-            # Clear existing data
-            worksheet.clear()
+    def _mark_uploaded(self, csv_path: Path, fingerprint: Optional[str]):
+        """Record a successful upload so an unchanged CSV is skipped next time."""
+        if fingerprint is None:
+            return
 
-            # Convert DataFrame to list of lists (including headers)
-            data = [df.columns.tolist()] + df.values.tolist()
+        try:
+            csv_path.with_name(csv_path.name + UPLOAD_MARKER_SUFFIX).write_text(fingerprint)
+        except OSError:
+            pass  # Only costs a redundant upload next run
+
+    def upload_csv_to_tab(self, csv_path: Path, tab_name: str, force: bool = False) -> bool:
+        """
+        Upload a CSV file to a specific Google Sheets tab.
+
+        Args:
+            csv_path: Path to the CSV file
+            tab_name: Name of the sheet tab to update
+            force: Upload even if this exact CSV was already uploaded to the tab
+
+        Returns:
+            bool: True if upload successful (or unchanged), False otherwise
+        """
+        try:
+            fingerprint = self._upload_fingerprint(csv_path, tab_name)
+            if not force and self._is_unchanged(csv_path, fingerprint):
+                print(f"⏭️  {tab_name}: Unchanged since last upload, skipping")
+                return True
+
+            data = self._read_csv_values(csv_path, tab_name)
+            if data is None:
+                return False
+
+            worksheet = self._get_or_create_worksheet(tab_name)
 
-            # Upload data in batch
-            worksheet.update(range_name='A1', values=data)
+            # Clear existing data and upload the new values in one request
+            _with_backoff(self.sheet.batch_update, {'requests': _replace_tab_requests(worksheet, data)})
+            _record_grid_size(worksheet, data)
 
-            print(f"✅ {tab_name}: Uploaded {len(df)} rows")
+            self._mark_uploaded(csv_path, fingerprint)
+            print(f"✅ {tab_name}: Uploaded {len(data) - 1} rows")
             return True
 
         except Exception as e:
             print(f"❌ {tab_name}: Upload failed - {e}")
             return False
 
+    def upload_csvs_batch(self, csv_files: Dict[str, Path], force: bool = False) -> Dict[str, bool]:
+        """
+        Upload several CSV files with one batchUpdate request that clears and writes every tab.
+
+        Per-tab reads and worksheet lookups are replaced by a single worksheet
+        listing; if a batch request fails, each tab is retried individually.
+
+        Args:
+            csv_files: Mapping of source names to CSV file paths
+            force: Upload even CSVs that are unchanged since their last upload
+
+        Returns:
+            Dict mapping source names to upload success status
+        """
+        results = dict.fromkeys(csv_files, False)
+        tab_values = {}
+        fingerprints = {}
+
+        for source, csv_path in csv_files.items():
+            tab_name = self.tab_mappings[source]
+            fingerprints[source] = self._upload_fingerprint(csv_path, tab_name)
+            if not force and self._is_unchanged(csv_path, fingerprints[source]):
+                print(f"⏭️  {tab_name}: Unchanged since last upload, skipping")
+                results[source] = True
+                continue
+
+            try:
+                data = self._read_csv_values(csv_path, tab_name)
+            except Exception as e:
+                print(f"❌ {tab_name}: Upload failed - {e}")
+                data = None
+
+            if data is not None:
+                tab_values[source] = (tab_name, data)
+
+        if not tab_values:
+            return results
+
+        try:
+            # One listing fills the handle cache for every tab instead of a lookup per tab
+            if any(tab_name not in self._worksheets for tab_name, _ in tab_values.values()):
+                self._worksheets.update(
+                    (worksheet.title, worksheet) for worksheet in _with_backoff(self.sheet.worksheets)
+                )
+            for tab_name, _ in tab_values.values():
+                if tab_name not in self._worksheets:
+                    print(f"📋 Creating new tab: {tab_name}")
+                    self._worksheets[tab_name] = _with_backoff(
+                        self.sheet.add_worksheet, title=tab_name, rows=1000, cols=26
+                    )
+
+            # Clear and rewrite every tab in a single batchUpdate round trip
+            requests = []
+            for tab_name, data in tab_values.values():
+                requests.extend(_replace_tab_requests(self._worksheets[tab_name], data))
+            _with_backoff(self.sheet.batch_update, {'requests': requests})
+            for tab_name, data in tab_values.values():
+                _record_grid_size(self._worksheets[tab_name], data)
+
+        except Exception as e:
+            print(f"⚠️  Batch upload failed ({e}), retrying tabs individually...")
+            for source in tab_values:
+                results[source] = self.upload_csv_to_tab(csv_files[source], self.tab_mappings[source], force)
+            return results
+
+        for source, (tab_name, data) in tab_values.items():
+            self._mark_uploaded(csv_files[source], fingerprints[source])
+            print(f"✅ {tab_name}: Uploaded {len(data) - 1} rows")
+            results[source] = True
+
+        return results
+
     def get_available_csvs(self) -> Dict[str, Path]:
         """
         Find available DFS CSV files to upload.
@@ -132,9 +428,10 @@ class SheetsUploader:
             Dict mapping source names to CSV file paths
         """
         available_files = {}
+        listings = {}  # Directory -> file names, so each source directory is read once
 
         # Check for each expected CSV file
-        downloads_dir = Path(__file__).parent.parent / "downloads"
+        downloads_dir = DOWNLOADS_DIR
 
         for source, tab_name in self.tab_mappings.items():
             # Handle SOS position-specific files
@@ -149,15 +446,64 @@ class SheetsUploader:
                 source_dir = downloads_dir / source
                 latest_file = source_dir / f"{source.replace('_', '-')}_latest.csv"
 
-            if latest_file.exists():
+            if source_dir not in listings:
+                try:
+                    listings[source_dir] = set(os.listdir(source_dir))
+                except (FileNotFoundError, NotADirectoryError):
+                    listings[source_dir] = set()
+
+            if latest_file.name in listings[source_dir]:
                 available_files[source] = latest_file
 
         return available_files
 
-    def upload_all_dfs_data(self) -> Dict[str, bool]:
+    def plan_upload(self, force: bool = False) -> UploadPlan:
+        """
+        Preview what upload_all_dfs_data would send, using only local files.
+
+        Makes no API calls, so it works without connecting. Row and cell counts
+        are estimates from line counts and the header width.
+
+        Args:
+            force: Plan as if unchanged CSVs would be re-uploaded too
+
+        Returns:
+            UploadPlan with per-tab data rows, skipped tabs, and request estimates
+        """
+        plan: UploadPlan = {'tabs': {}, 'skipped': [], 'estimated_cells': 0, 'estimated_api_calls': 0}
+
+        for source, csv_path in self.get_available_csvs().items():
+            tab_name = self.tab_mappings[source]
+            fingerprint = self._upload_fingerprint(csv_path, tab_name)
+            if not force and self._is_unchanged(csv_path, fingerprint):
+                plan['skipped'].append(tab_name)
+                continue
+
+            try:
+                with open(csv_path, 'rb') as f:
+                    header = f.readline()
+                    data_rows = sum(1 for line in f if line.strip())
+            except OSError:
+                continue
+
+            plan['tabs'][tab_name] = data_rows
+            plan['estimated_cells'] += (data_rows + 1) * (header.count(b',') + 1)
+
+        if plan['tabs']:
+            plan['estimated_api_calls'] = 3  # Open the sheet, list its tabs, one batchUpdate
+
+        return plan
+
+    def upload_all_dfs_data(self, force: bool = False) -> Dict[str, bool]:
         """
         Upload all available DFS CSV files to their respective Google Sheets tabs.
 
+        CSVs whose content matches their last successful upload are skipped
+        unless force is set.
+
+        Args:
+            force: Re-upload every CSV even if unchanged
+
         Returns:
             Dict mapping source names to upload success status
         """
@@ -171,12 +517,7 @@ class SheetsUploader:
 
         print(f"📊 Found {len(available_files)} file(s) to upload")
 
-        results = {}
-
-        for source, csv_path in available_files.items():
-            tab_name = self.tab_mappings[source]
-            success = self.upload_csv_to_tab(csv_path, tab_name)
-            results[source] = success
+        results = self.upload_csvs_batch(available_files, force)
 
         # Summary
         successful_uploads = sum(results.values())
@@ -216,13 +557,15 @@ def validate_credentials(credentials_path: str) -> bool:
     """
     cred_path = Path(credentials_path)
 
-    if not cred_path.exists():
+    # One stat answers both existence and permissions
+    try:
+        file_stat = cred_path.stat()
+    except FileNotFoundError:
         print(f"❌ Credentials file not found: {credentials_path}")
         print("💡 Please download your Google service account JSON file")
         return False
 
     # Check file permissions (warn if too open)
-    file_stat = cred_path.stat()
     file_mode = oct(file_stat.st_mode)[-3:]
 
     if file_mode != '600':  # Not owner read/write only
@@ -5,18 +5,34 @@ DFS Workflow Management Utilities
 Workflow orchestration system for DFS data pipelines.
 """
 
+import contextlib
+import functools
+import io
+import sys
 import traceback
 
 try:
     # When imported as a module from main scripts
     from utils.config import get_google_sheets_config, validate_google_sheets_config
     from utils.file_manager import organize_downloads, show_organization_summary
-    from utils.sheets_uploader import SheetsUploader, validate_credentials
 except ImportError:
     # When run directly from utils directory
     from config import get_google_sheets_config, validate_google_sheets_config
     from file_manager import organize_downloads, show_organization_summary
-    from sheets_uploader import SheetsUploader, validate_credentials
+
+
+def buffered_output(func):
+    """Collect everything a print-heavy function writes and emit it with a single write."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
 
 
 def organize_files() -> bool:
@@ -45,8 +61,13 @@ def organize_files() -> bool:
         print()  # Add spacing for better output formatting
 
 
-def upload_to_sheets() -> bool:
-    """Execute Google Sheets upload workflow for DFS data synchronization."""
+def upload_to_sheets(force: bool = False) -> bool:
+    """
+    Execute Google Sheets upload workflow for DFS data synchronization.
+
+    Args:
+        force: Re-upload every CSV even if unchanged since its last upload
+    """
     try:
         print("\n🔄 Google Sheets Upload...")
 
@@ -55,6 +76,12 @@ def upload_to_sheets() -> bool:
             print("💡 Check your config.json file and ensure proper Google Sheets setup")
             return False
 
+        # Imported here so runs that skip the upload never load pandas/gspread
+        try:
+            from utils.sheets_uploader import SheetsUploader, validate_credentials
+        except ImportError:
+            from sheets_uploader import SheetsUploader, validate_credentials
+
         # Validate API credentials and permissions
         if not validate_credentials(sheets_config['credentials_file']):
             print("💡 Ensure credentials.json is valid and has proper permissions")
@@ -65,7 +92,7 @@ def upload_to_sheets() -> bool:
             sheets_config['sheet_id'],
             sheets_config['tab_mappings']
         )
-        results = uploader.upload_all_dfs_data()
+        results = uploader.upload_all_dfs_data(force)
 
         # Evaluate upload success based on results
         return any(results.values()) if results else False
@@ -78,6 +105,35 @@ def upload_to_sheets() -> bool:
         return False
 
 
+def plan_upload(force: bool = False):
+    """
+    Preview the Google Sheets upload from local files, without any API calls.
+
+    Args:
+        force: Plan as if every CSV had changed since its last upload
+
+    Returns:
+        dict or None: UploadPlan from SheetsUploader.plan_upload, or None if not configured
+    """
+    sheets_config = get_google_sheets_config()
+    if not validate_google_sheets_config(sheets_config):
+        return None
+
+    try:
+        from utils.sheets_uploader import SheetsUploader
+    except ImportError:
+        from sheets_uploader import SheetsUploader
+
+    uploader = SheetsUploader(
+        sheets_config['credentials_file'],
+        sheets_config['sheet_id'],
+        sheets_config['tab_mappings'],
+        connect=False
+    )
+    return uploader.plan_upload(force)
+
+
+@buffered_output
 def print_workflow_header(title="DFS Complete Workflow - Collect & Organize", include_cleanup=True):
     """Print a standardized workflow header."""
     print(f"🏈 {title}")
@@ -95,6 +151,7 @@ def print_workflow_header(title="DFS Complete Workflow - Collect & Organize", in
     print()
 
 
+@buffered_output
 def print_update_header():
     """Print the quick update header and description."""
     print("🔄 DFS Quick Update - Projections & Odds")
@@ -105,6 +162,7 @@ def print_update_header():
     print()
 
 
+@buffered_output
 def print_update_summary(successful, total, upload_success=False, upload_skipped=False):
     """Print summary for update workflow."""
     if successful == total:
@@ -123,6 +181,7 @@ def print_update_summary(successful, total, upload_success=False, upload_skipped
     print("📝 Note: DraftKings salaries not updated (run 'run_all.py' for full refresh)")
 
 
+@buffered_output
 def print_final_summary(successful, total, organize_success, upload_success=False, upload_skipped=False):
     """Print final workflow summary and next steps."""
     print("🎯 Workflow Summary:")